@@ -0,0 +1,135 @@
+"""Measure how many records per second the PolyLog formatters can format.
+
+Run with `python benchmarks/log_formatters.py [records]` from an environment with polykit
+installed. Each CustomFormatter configuration is compared with the original implementation, which
+resolved the timezone, rendered the timestamp and built the colored text again for every record.
+The standard library's default formatter is included as a point of reference.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo
+
+from polykit.log.formatters import LEVEL_TEXTS, CustomFormatter, FileFormatter, JSONFormatter
+from polykit.log.types import LogColors, LogLevel
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR)
+
+
+@dataclass
+class BaselineFormatter(logging.Formatter):
+    """CustomFormatter as it was before it cached anything, for comparison."""
+
+    simple: bool = False
+    show_context: bool = False
+    color: bool = True
+
+    def __post_init__(self):
+        super().__init__()
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa
+        """Format the time in a log record."""
+        tz = ZoneInfo(os.getenv("TZ", "America/New_York"))
+        ct = datetime.fromtimestamp(record.created, tz=tz)
+        return ct.strftime(datefmt) if datefmt else ct.isoformat()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the log record based on the formatter style."""
+        if self.color:
+            level_color = LogLevel.get_color(record.levelname)
+            reset = LogColors.RESET
+            bold = LogColors.BOLD
+            gray = LogColors.GRAY
+            blue = LogColors.BLUE
+            cyan = LogColors.CYAN
+        else:
+            level_color = reset = bold = gray = blue = cyan = ""
+
+        record.asctime = self.formatTime(record, "%I:%M:%S %p")
+
+        if self.simple:
+            bold = "" if record.levelname in {"DEBUG", "INFO"} else bold
+            return f"{reset}{bold}{level_color}{record.getMessage()}{reset}"
+
+        timestamp = f"{reset}{gray}{record.asctime}{reset} "
+        log_level = f"{bold}{level_color}{LEVEL_TEXTS.get(record.levelname, '')}{reset}"
+        if record.levelname not in {"DEBUG", "INFO"}:
+            reset = f"{level_color}{reset}"
+
+        class_name = f" {blue}{record.name}:{reset} " if self.show_context else ""
+        function = f"{cyan}{record.funcName}: " if self.show_context else " "
+        message = f"{level_color}{record.getMessage()}{reset}"
+        return f"{timestamp}{log_level}{class_name}{function}{message}"
+
+
+def make_records(count: int) -> list[logging.LogRecord]:
+    """Create records across all common levels, spread over a few seconds of timestamps."""
+    start = time.time()
+    records = []
+    for index in range(count):
+        record = logging.LogRecord(
+            "benchmark", LEVELS[index % 4], __file__, 1, "Processed %s items", (index,), None, "run"
+        )
+        record.created = start + index / 10_000
+        records.append(record)
+    return records
+
+
+def records_per_second(formatter: logging.Formatter, records: Sequence[logging.LogRecord]) -> float:
+    """Format every record once and return the rate."""
+    format_record = formatter.format
+    start = time.perf_counter()
+    for record in records:
+        format_record(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(count: int = 100_000) -> None:
+    """Print the formatting rate of each formatter configuration."""
+    records = make_records(count)
+    options: dict[str, dict[str, bool]] = {
+        "default": {},
+        "show_context=True": {"show_context": True},
+        "simple=True": {"simple": True},
+        "color=False": {"color": False},
+    }
+
+    print(f"CustomFormatter, {count:,} records (records/s)")
+    print(f"  {'options':<20}{'baseline':>12}{'current':>12}{'speedup':>10}")
+    for name, kwargs in options.items():
+        baseline_formatter = BaselineFormatter(**kwargs)
+        current_formatter = CustomFormatter(**kwargs)
+
+        # Both must produce the same output for the comparison to mean anything
+        if current_formatter.format(records[0]) != baseline_formatter.format(records[0]):
+            print(f"  {name:<20}output differs from the baseline")
+            continue
+
+        baseline = records_per_second(baseline_formatter, records)
+        current = records_per_second(current_formatter, records)
+        print(f"  {name:<20}{baseline:>12,.0f}{current:>12,.0f}{current / baseline:>9.1f}x")
+
+    others: dict[str, logging.Formatter] = {
+        "FileFormatter": FileFormatter(),
+        "JSONFormatter": JSONFormatter(),
+        "logging.Formatter": logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s: %(funcName)s: %(message)s"
+        ),
+    }
+    print("\nOther formatters (records/s)")
+    for name, formatter in others.items():
+        print(f"  {name:<20}{records_per_second(formatter, records):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
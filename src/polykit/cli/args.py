@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import argparse
 import re
+import sys
 import textwrap
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from polykit.packages import VersionChecker
+from polykit.packages import VersionCache, VersionChecker
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 class ArgParser(argparse.ArgumentParser):
@@ -85,16 +89,8 @@ class ArgParser(argparse.ArgumentParser):
         return super().add_argument(*args, **kwargs)
 
     def _add_version_argument(self) -> None:
-        """Add a version argument that automatically detects package version."""
-        # Get the package name from the script name
-        package_name = VersionChecker.get_caller_package_name()
-
-        # Use the VersionChecker to get comprehensive version info
-        checker = VersionChecker()
-        version_info = checker.check_package(package_name)
-
-        # Add the version argument
-        self.add_argument(*self.version_flags, action="version", version=str(version_info))
+        """Add a version argument that detects the package version only when it's used."""
+        self.add_argument(*self.version_flags, action=LazyVersionAction)
 
     def _format_description_text(self, text: str, lines: int = 0) -> str:
         """Prepare description text by preserving paragraph structure.
@@ -209,3 +205,47 @@ class CustomHelpFormatter(argparse.HelpFormatter):
                 space_to_insert = max(self.custom_max_help_position - help_position, 0)
                 parts = parts[:help_position] + (" " * space_to_insert) + parts[help_position:]
         return parts
+
+
+class LazyVersionAction(argparse.Action):
+    """Print version information and exit, like argparse's "version" action.
+
+    Detecting the package name scans installed entry points and checking for updates may go to the
+    network, so both are deferred until the flag is actually passed instead of running every time
+    the parser is created. The output is the same as passing `str(VersionInfo)` as the version.
+    """
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: str = "show program's version number and exit",  # noqa: A002
+    ):
+        super().__init__(
+            option_strings=option_strings, dest=dest, default=default, nargs=0, help=help
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,  # noqa: ARG002
+        values: str | Sequence[Any] | None,  # noqa: ARG002
+        option_string: str | None = None,  # noqa: ARG002
+    ) -> None:
+        """Resolve the package version, print it, and exit."""
+        # Get the package name from the script name
+        package_name = VersionChecker.get_caller_package_name()
+
+        # Use the VersionChecker to get comprehensive version info, caching the remote lookup
+        try:
+            cache = VersionCache.on_disk()
+        except OSError:  # The cache directory can't be created, so only cache in memory
+            cache = VersionCache()
+        checker = VersionChecker(cache=cache)
+        version_info = checker.check_package(package_name)
+
+        formatter = parser._get_formatter()  # noqa: SLF001
+        formatter.add_text(str(version_info))
+        parser._print_message(formatter.format_help(), sys.stdout)  # noqa: SLF001
+        parser.exit()
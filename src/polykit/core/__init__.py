@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from .atomic import write_atomic
+from .json_store import JSONStore
 from .decorators import async_retry_on_exception, retry_on_exception, with_retries
 from .is_literal import is_literal
 from .singleton import Singleton
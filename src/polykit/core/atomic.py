@@ -0,0 +1,37 @@
+"""Atomic file writes, shared by the on-disk caches and the patch tools."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+# The process umask, read once at import since reading it means briefly setting it to something else
+_umask = os.umask(0o022)
+os.umask(_umask)
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write text to a file atomically, preserving the mode of an existing file.
+
+    The content is written to a temporary file in the same directory and moved into place, so
+    readers never see a partially written file. Missing parent directories are created, and a new
+    file gets the usual mode for the umask rather than the private mode of the temporary file.
+
+    Raises:
+        OSError: If the file can't be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as temp_file:
+            temp_file.write(text)
+        if path.exists():
+            shutil.copymode(path, temp_name)
+        else:
+            Path(temp_name).chmod(0o666 & ~_umask)
+        Path(temp_name).replace(path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
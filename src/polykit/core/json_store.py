@@ -0,0 +1,85 @@
+"""A directory of small JSON files, one per key, backing the on-disk tier of polykit's caches."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from polykit.core.atomic import write_atomic
+
+
+class JSONStore:
+    """Best-effort persistent storage for cache entries, with one JSON file per key.
+
+    Files are named by a hash of their key, and written atomically so readers never see a partial
+    entry. Errors are never raised from reading or writing, since a cache that can't use its
+    directory should still work in memory: a missing, unreadable or corrupt file reads as None, and
+    a failed write is skipped. If `max_entries` is set, reading a file marks it as recently used,
+    and the least recently used files beyond the limit are removed after each write.
+
+    Args:
+        directory: The directory to keep the files in, which is created if needed.
+        max_entries: The maximum number of files to keep, or None for no limit.
+
+    Raises:
+        OSError: If the directory can't be created.
+    """
+
+    def __init__(self, directory: str | Path, max_entries: int | None = None):
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def app_cache_dir(app_name: str, name: str) -> Path:
+        """Get a subdirectory of the PolyPaths cache directory for the given app.
+
+        Args:
+            app_name: The application name used to locate the cache directory.
+            name: The subdirectory to use, such as "versions".
+        """
+        from polykit.paths import PolyPaths
+
+        return PolyPaths(app_name).from_cache(name)
+
+    def read(self, key: str) -> Any:
+        """Read the data stored under a key, or None if there is none or it can't be read."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if self.max_entries is not None:
+                os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def write(self, key: str, data: Any) -> None:
+        """Store data under a key, replacing anything already there."""
+        with contextlib.suppress(OSError):
+            write_atomic(self._path(key), json.dumps(data, separators=(",", ":")))
+            if self.max_entries is not None:
+                self._prune()
+
+    def clear(self) -> None:
+        """Remove every stored file."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Get the file a key is stored in, named by a hash of the key."""
+        return self.directory / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+
+    def _prune(self) -> None:
+        """Remove the least recently used files beyond `max_entries`."""
+        if self.max_entries is None:
+            return
+        paths = list(self.directory.glob("*.json"))
+        if len(paths) <= self.max_entries:
+            return
+        paths.sort(key=lambda path: path.stat().st_mtime)
+        for path in paths[: len(paths) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -145,4 +145,5 @@ os.environ["ENV_DEBUG"] = "1"
 
 from __future__ import annotations
 
+from .frozen import FrozenEnv
 from .polyenv import PolyEnv
@@ -0,0 +1,98 @@
+"""Compiled PolyEnv snapshots that let a process skip .env discovery and parsing."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from polykit.core.atomic import write_atomic
+from polykit.env.loader import FileSignature, file_signature
+
+# Bump when the stored layout changes so old snapshots are ignored
+SNAPSHOT_FORMAT = 3
+
+
+@dataclass
+class CompiledEnv:
+    """A loaded PolyEnv configuration and the fingerprint of where it came from.
+
+    The fingerprint covers the list of candidate .env files, the signature (modification time and
+    size) of each of them, including missing ones, and the raw value each registered variable had.
+    A snapshot is only used if all of those still match, so different custom files, a different
+    working directory, a changed file, a new file in the hierarchy or a different value in the
+    process environment all cause a normal load instead.
+
+    Snapshots are stored as JSON and only hold raw strings, which are converted again when they're
+    read, so loading one never runs code. Values of secret variables are never stored: if the
+    files define any, only their names are recorded, and the files that define them are parsed
+    again on load.
+
+    Args:
+        files: The signature of every candidate file, by path, in load order.
+        file_values: The merged raw values loaded from the files, without secrets.
+        sources: The file each loaded value came from, by variable name.
+        raw: The raw value of each registered non-secret variable at compile time, or None if it
+            was unset.
+        secrets: The names of secret variables the files define, whose values weren't stored.
+    """
+
+    files: dict[str, FileSignature] = field(default_factory=dict)
+    file_values: dict[str, str] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
+    raw: dict[str, str | None] = field(default_factory=dict)
+    secrets: list[str] = field(default_factory=list)
+
+    def is_current(self, env_files: list[Path]) -> bool:
+        """Check whether the snapshot still matches the files and the process environment.
+
+        Args:
+            env_files: The absolute paths of the env files that would be loaded now, either the
+                custom files requested or the ones found from the working directory, which must be
+                the same files the snapshot was compiled from.
+
+        Returns:
+            True if the snapshot can be used as-is, False if the configuration must be loaded.
+        """
+        if [str(path) for path in env_files] != list(self.files):
+            return False
+
+        for path, signature in self.files.items():
+            if file_signature(Path(path)) != signature:
+                return False
+
+        # Files override the process environment, so only variables they don't set can differ
+        environ = os.environ
+        return all(
+            name in self.sources or environ.get(name) == raw for name, raw in self.raw.items()
+        )
+
+    def write(self, path: Path) -> None:
+        """Write the snapshot to a file atomically.
+
+        Raises:
+            OSError: If the file can't be written.
+        """
+        write_atomic(path, json.dumps({"format": SNAPSHOT_FORMAT, **asdict(self)}))
+
+    @classmethod
+    def read(cls, path: Path) -> CompiledEnv | None:
+        """Read a snapshot from a file.
+
+        Returns:
+            The snapshot, or None if the file is missing, unreadable or from another format.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.pop("format") != SNAPSHOT_FORMAT:
+                return None
+            snapshot = cls(**data)
+            # JSON has no tuples, so restore the signatures to compare equal to file_signature()
+            snapshot.files = {
+                file: (signature[0], signature[1]) if signature is not None else None
+                for file, signature in snapshot.files.items()
+            }
+        except (OSError, ValueError, LookupError, TypeError, AttributeError):
+            return None
+        return snapshot
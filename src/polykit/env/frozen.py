@@ -0,0 +1,122 @@
+"""Frozen, slotted snapshots of PolyEnv values for fast attribute reads."""
+
+from __future__ import annotations
+
+import types
+from dataclasses import FrozenInstanceError
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Union, get_args, get_origin
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+_classes: dict[tuple[tuple[str, ...], frozenset[str]], type[FrozenEnv]] = {}
+_classes_lock = Lock()
+
+
+class FrozenEnv:
+    """An immutable set of validated environment values, stored in slots.
+
+    Each registered variable is a plain attribute under its attribute name, so reading one is a
+    single slot lookup with none of the work PolyEnv does on each access. Use `PolyEnv.freeze()`
+    to create one; the values don't change when the environment does, so freeze again after a
+    reload if you need the new values.
+    """
+
+    __slots__ = ()
+
+    _secrets: ClassVar[frozenset[str]] = frozenset()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        msg = f"cannot assign to field '{name}'"
+        raise FrozenInstanceError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"cannot delete field '{name}'"
+        raise FrozenInstanceError(msg)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={'[MASKED]' if name in self._secrets else repr(value)}"
+            for name, value in self.as_dict().items()
+        )
+        return f"FrozenEnv({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenEnv):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the values as a dictionary, by attribute name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def freeze_values(values: Mapping[str, Any], secrets: Iterable[str] = ()) -> FrozenEnv:
+    """Create a frozen snapshot with one slotted attribute per value.
+
+    The generated class is cached by its attribute names, so freezing the same set of variables
+    again reuses it.
+
+    Args:
+        values: The values to store, by attribute name.
+        secrets: The attribute names to mask in the snapshot's repr.
+
+    Returns:
+        The frozen snapshot.
+
+    Raises:
+        ValueError: If an attribute name would hide a FrozenEnv method or attribute, like
+            `as_dict`.
+    """
+    if clashes := sorted(name for name in values if hasattr(FrozenEnv, name)):
+        msg = f"Can't freeze variables named {', '.join(clashes)}, which FrozenEnv already uses"
+        raise ValueError(msg)
+
+    key = (tuple(values), frozenset(secrets))
+    with _classes_lock:
+        frozen_class = _classes.get(key)
+        if frozen_class is None:
+            frozen_class = type(
+                "FrozenEnv",
+                (FrozenEnv,),
+                {"__slots__": key[0], "_secrets": key[1], "__module__": __name__},
+            )
+            _classes[key] = frozen_class
+
+    instance = object.__new__(frozen_class)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def field_converter(hint: Any, bool_converter: Callable[[str], bool]) -> Callable[[str], Any]:
+    """Get the converter for a schema field from its type annotation.
+
+    Plain classes are used as converters directly, except `bool`, which uses `bool_converter` so
+    strings like "no" are handled properly. Optional types like `int | None` use the converter of
+    the inner type.
+
+    Args:
+        hint: The field's resolved type annotation.
+        bool_converter: The converter to use for boolean fields.
+
+    Raises:
+        TypeError: If the annotation has no obvious converter, such as `list[str]`. Register the
+            variable with add_var() and a custom var_type before freezing instead.
+    """
+    if get_origin(hint) in {Union, types.UnionType}:
+        inner = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(inner) == 1:
+            hint = inner[0]
+
+    if hint is bool:
+        return bool_converter
+    if isinstance(hint, type):
+        return hint
+
+    msg = f"Can't convert environment values to {hint!r}; register the variable with add_var()"
+    raise TypeError(msg)
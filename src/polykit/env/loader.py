@@ -0,0 +1,126 @@
+"""Parse and merge .env files in a single pass, caching parsed files between loads."""
+
+from __future__ import annotations
+
+import os
+import stat
+from collections import ChainMap
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from dotenv import dotenv_values
+from dotenv.variables import parse_variables
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+# A file's modification time in nanoseconds and its size, or None if it doesn't exist
+FileSignature = tuple[int, int] | None
+
+_parse_cache: dict[Path, tuple[tuple[int, int], dict[str, str | None]]] = {}
+_parse_lock = Lock()
+
+
+@dataclass
+class LoadedEnv:
+    """The merged result of loading a list of .env files.
+
+    Args:
+        values: The merged, interpolated values, with later files taking precedence.
+        sources: The file each value came from.
+        signatures: The signature of every candidate file, including missing ones, in load order.
+        counts: The number of variables each existing file defined.
+    """
+
+    values: dict[str, str] = field(default_factory=dict)
+    sources: dict[str, Path] = field(default_factory=dict)
+    signatures: dict[Path, FileSignature] = field(default_factory=dict)
+    counts: dict[Path, int] = field(default_factory=dict)
+
+
+def file_signature(path: Path) -> FileSignature:
+    """Get a file's modification time and size with a single stat, or None if it isn't a file."""
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(info.st_mode):
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def parse_env_file(path: Path, signature: tuple[int, int]) -> dict[str, str | None]:
+    """Parse a .env file without interpolation, reusing the last parse if the file is unchanged.
+
+    Args:
+        path: The absolute path of the file.
+        signature: The file's current signature from file_signature().
+
+    Returns:
+        The raw values defined in the file, in file order.
+    """
+    with _parse_lock:
+        cached = _parse_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    values = dotenv_values(path, interpolate=False)
+    with _parse_lock:
+        _parse_cache[path] = (signature, values)
+    return values
+
+
+def clear_parse_cache() -> None:
+    """Forget all parsed files, so the next load reads them from disk again."""
+    with _parse_lock:
+        _parse_cache.clear()
+
+
+def load_env_files(files: Iterable[Path]) -> LoadedEnv:
+    """Parse and merge .env files in order, without touching os.environ.
+
+    This gives the same result as calling `load_dotenv(file, override=True)` on each file in turn:
+    later files override earlier ones, and `${VAR}` references resolve against the values merged
+    so far, then against the current environment. Keys without a value are ignored, as they are by
+    `load_dotenv`.
+
+    Args:
+        files: The absolute paths of the candidate files, in load order. Missing files are skipped.
+
+    Returns:
+        The merged values with their provenance.
+    """
+    loaded = LoadedEnv()
+    lookup = ChainMap(loaded.values, os.environ)
+
+    for path in files:
+        signature = loaded.signatures[path] = file_signature(path)
+        if signature is None:
+            continue
+
+        raw = parse_env_file(path, signature)
+        loaded.counts[path] = len(raw)
+        for key, value in raw.items():
+            if value is None:
+                continue
+            if "$" in value:
+                value = "".join(atom.resolve(lookup) for atom in parse_variables(value))
+            loaded.values[key] = value
+            loaded.sources[key] = path
+
+    return loaded
+
+
+def changed_files(signatures: Mapping[Path, FileSignature]) -> list[Path]:
+    """Get the files whose signature no longer matches, including ones created or deleted since."""
+    return [path for path, signature in signatures.items() if file_signature(path) != signature]
+
+
+def apply_to_environ(values: Mapping[str, str]) -> None:
+    """Write values to os.environ in one pass, skipping those that are already set."""
+    environ = os.environ
+    for key, value in values.items():
+        if environ.get(key) != value:
+            environ[key] = value
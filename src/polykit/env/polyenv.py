@@ -1,22 +1,43 @@
 from __future__ import annotations
 
+import dataclasses
 import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
-
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, get_type_hints
 
 from polykit.core import Singleton
-from polykit.env.types import PolyVar
+from polykit.env.compiled import CompiledEnv
+from polykit.env.frozen import FrozenEnv, field_converter, freeze_values
+from polykit.env.loader import (
+    LoadedEnv,
+    apply_to_environ,
+    changed_files,
+    load_env_files,
+    parse_env_file,
+)
+from polykit.env.types import ConversionStats, PolyVar
+from polykit.formatters import Text
 from polykit.log import PolyLog
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from logging import Logger
 
 T = TypeVar("T")
 
+# Marks a value missing from the cache, where None is a valid cached value
+_MISSING = object()
+
+# Values overridden in the current context, by the id of the PolyEnv instance they apply to. This
+# is shared by all instances, since context variables are meant to be created once at module level.
+_overrides: ContextVar[Mapping[int, Mapping[str, Any]] | None] = ContextVar(
+    "polyenv_overrides", default=None
+)
+
 
 @dataclass
 class PolyEnv(metaclass=Singleton):
@@ -44,6 +65,11 @@ class PolyEnv(metaclass=Singleton):
     override broader ones. For example, if you have /home/user/.env and /home/user/project/.env,
     variables in the project-specific file will take precedence.
 
+    All files are parsed and merged before anything is written to `os.environ`, which is then
+    updated in a single pass. Parsed files are cached by path, modification time and size, so
+    creating another instance or calling `refresh()` only re-parses files that changed. The file
+    each loaded variable came from is recorded in `sources`.
+
     For detailed logging for PolyEnv itself, set the ENV_DEBUG environment variable to '1'.
 
     Args:
@@ -55,6 +81,10 @@ class PolyEnv(metaclass=Singleton):
     # File name to look for in directories
     ENV_FILENAME: ClassVar[str] = ".env"
 
+    # A compiled snapshot to start from instead of loading files, set only by load_compiled()
+    _pending_snapshot: ClassVar[CompiledEnv | None] = None
+    _snapshot_lock: ClassVar[threading.Lock] = threading.Lock()
+
     env_file: list[Path] | Path | str | None = field(default_factory=list)
     add_debug: bool = False
 
@@ -63,6 +93,18 @@ class PolyEnv(metaclass=Singleton):
     vars: dict[str, PolyVar] = field(default_factory=dict)
     values: dict[str, Any] = field(default_factory=dict)
     attr_names: dict[str, str] = field(default_factory=dict)
+    sources: dict[str, Path] = field(default_factory=dict)
+    compiled_from: Path | None = field(default=None, init=False)
+
+    _converted: dict[str, tuple[Any, Any]] = field(default_factory=dict, init=False, repr=False)
+    _environ_values: dict[str, str | None] = field(default_factory=dict, init=False, repr=False)
+    _stats: dict[str, ConversionStats] = field(default_factory=dict, init=False, repr=False)
+    _loaded: LoadedEnv = field(default_factory=LoadedEnv, init=False, repr=False)
+    _subscribers: list[Callable[[set[str]], None]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _watcher: threading.Thread | None = field(default=None, init=False, repr=False)
+    _stop_watching: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize with default environment variables."""
@@ -81,41 +123,48 @@ class PolyEnv(metaclass=Singleton):
         # Set up the logger
         self.logger = PolyLog.get_logger(level="DEBUG" if env_debug else "INFO")
 
-        # Load environment variables from files
-        self._load_env_files()
+        # Load environment variables from files, unless starting from a compiled snapshot
+        snapshot, PolyEnv._pending_snapshot = PolyEnv._pending_snapshot, None
+        if snapshot is None:
+            self._load_env_files()
 
         if self.add_debug and "DEBUG" not in self.vars:
             self.add_debug_var()
 
-    def _load_env_files(self) -> None:
-        """Load environment variables from specified files, including parent directories."""
-        if not self.env_file:  # If no specific files are provided, use hierarchical loading
-            env_files = []
+    @classmethod
+    def _hierarchy_env_files(cls) -> list[Path]:
+        """Get the .env files to load when none are specified, from the furthest to the closest."""
+        env_files = []
+
+        # Add .env files from parent directories (from root toward current dir)
+        current_dir = Path.cwd().absolute()
+        parent_dirs = list(current_dir.parents)
 
-            # Add .env files from parent directories (from root toward current dir)
-            current_dir = Path.cwd().absolute()
-            parent_dirs = list(current_dir.parents)
+        # Limit how far up we go - stop at the user's home directory
+        home_dir = Path.home()
+        if home_dir in parent_dirs:
+            # Only include parents up to and including home directory
+            parent_dirs = parent_dirs[: parent_dirs.index(home_dir) + 1]
 
-            # Limit how far up we go - stop at the user's home directory
-            home_dir = Path.home()
-            if home_dir in parent_dirs:
-                # Only include parents up to and including home directory
-                parent_dirs = parent_dirs[: parent_dirs.index(home_dir) + 1]
+        # Add parent directories in reverse order (from furthest to closest)
+        for parent in reversed(parent_dirs):
+            parent_env = parent / cls.ENV_FILENAME
+            env_files.append(parent_env)
 
-            # Add parent directories in reverse order (from furthest to closest)
-            for parent in reversed(parent_dirs):
-                parent_env = parent / self.ENV_FILENAME
-                env_files.append(parent_env)
+        # Add current directory's .env
+        env_files.append(Path(cls.ENV_FILENAME))
 
-            # Add current directory's .env
-            env_files.append(Path(self.ENV_FILENAME))
+        # Add ~/.env explicitly to ensure it's always checked
+        home_env = Path(f"~/{cls.ENV_FILENAME}").expanduser()
+        if home_env not in env_files:
+            env_files.append(home_env)
 
-            # Add ~/.env explicitly to ensure it's always checked
-            home_env = Path(f"~/{self.ENV_FILENAME}").expanduser()
-            if home_env not in env_files:
-                env_files.append(home_env)
+        return env_files
 
-            self.env_file = env_files
+    def _load_env_files(self) -> None:
+        """Load environment variables from specified files, including parent directories."""
+        if not self.env_file:  # If no specific files are provided, use hierarchical loading
+            self.env_file = self._hierarchy_env_files()
             self.logger.debug("Using hierarchical env files: %s", [str(f) for f in self.env_file])
         else:  # Custom files were specified, so use only those
             self.logger.debug(
@@ -129,39 +178,268 @@ class PolyEnv(metaclass=Singleton):
             [Path(self.env_file)] if isinstance(self.env_file, str | Path) else self.env_file
         )
 
-        # Track which variables came from which files for potential debugging
-        loaded_from = {}
+        # Parse and merge every file first, then write the result to os.environ in one pass
+        loaded = load_env_files([Path(file).expanduser().absolute() for file in env_files])
+        apply_to_environ(loaded.values)
+        self.sources = loaded.sources
+        self._loaded = loaded
+
+        if self.logger.isEnabledFor(10):  # DEBUG level
+            for path, signature in loaded.signatures.items():
+                if signature is None:
+                    self.logger.debug("No env file found: %s", path)
+                else:
+                    self.logger.debug(
+                        "Env load from %s: %s loaded",
+                        path,
+                        Text.plural("variable", loaded.counts[path], with_count=True),
+                    )
+
+            if loaded.sources:
+                self.logger.debug("Environment variables loaded from:")
+                for var, source in sorted(loaded.sources.items()):
+                    self.logger.debug("  %s: %s", var, source)
+
+    def refresh(self) -> None:
+        """Reload environment variables from files and clear cached values.
+
+        Each converted value is remembered with the raw value it came from, so only variables
+        whose raw value actually changed are converted again.
+        """
+        self._load_env_files()
+        self.values.clear()
+        self.compiled_from = None
+        self.logger.info("PolyEnv environment flushed and reloaded.")
+
+    def compile(self, path: str | Path) -> None:
+        """Validate every registered variable and save the loaded configuration as a snapshot.
+
+        The snapshot records the raw values loaded from the files together with a fingerprint of
+        those files and the raw value of each registered variable. A later process can start from
+        it with load_compiled(), skipping .env discovery and parsing as long as nothing has
+        changed. Values of secret variables are left out. Compile after registering all variables,
+        since only registered variables are checked for changes.
+
+        Args:
+            path: The file to write the snapshot to.
+
+        Raises:
+            ValueError: If any registered variable is missing or invalid.
+            RuntimeError: If called inside an override() block.
+        """
+        if self._context_overrides():
+            msg = "Can't compile the environment while overrides are active"
+            raise RuntimeError(msg)
+
+        self.validate_all()
+        secrets = {name for name, var in self.vars.items() if var.secret}
+        snapshot = CompiledEnv(
+            files={str(file): signature for file, signature in self._loaded.signatures.items()},
+            file_values={
+                name: value for name, value in self._loaded.values.items() if name not in secrets
+            },
+            sources={name: str(source) for name, source in self._loaded.sources.items()},
+            raw={name: os.environ.get(name) for name in self.vars if name not in secrets},
+            secrets=sorted(secrets & self._loaded.values.keys()),
+        )
+        snapshot.write(Path(path).expanduser())
+        self.logger.debug(
+            "Compiled %s to %s", Text.plural("variable", len(self.vars), with_count=True), path
+        )
+
+    @classmethod
+    def load_compiled(cls, path: str | Path, **kwargs: Any) -> PolyEnv:
+        """Get the PolyEnv instance, starting from a compiled snapshot if it's still current.
+
+        If the snapshot matches (see `CompiledEnv.is_current`), its file values are written to
+        `os.environ` without looking for .env files, and only the files that define secrets are
+        parsed again, or every file if a secret refers to other variables. Variables still need to
+        be registered as usual, and are converted when they're first read. If the snapshot is
+        missing or out of date, this is the same as creating PolyEnv normally, and `compiled_from`
+        is None so you know to call compile() again.
 
-        for file in env_files:
-            full_path = Path(file).expanduser()
-            abs_path = full_path.absolute()
+        Call this before anything else creates the PolyEnv instance, since a snapshot can't be
+        applied to one that already has live values.
 
-            self.logger.debug("Checking for env file: %s", abs_path)
-            if full_path.exists():
-                self.logger.debug("Loading env from: %s", abs_path)
-                # Track which variables were loaded from this file
-                before_keys = set(os.environ.keys())
-                load_dotenv(str(full_path), override=True)
-                after_keys = set(os.environ.keys())
+        Args:
+            path: The snapshot file written by compile().
+            **kwargs: Arguments for the PolyEnv constructor.
 
-                new_keys = after_keys - before_keys
-                for key in new_keys:
-                    loaded_from[key] = str(abs_path)
+        Returns:
+            The PolyEnv instance.
 
-                self.logger.debug("Env load from %s: %s variables loaded", abs_path, len(new_keys))
+        Raises:
+            RuntimeError: If the snapshot is current but the PolyEnv instance already exists.
+        """
+        path = Path(path).expanduser()
+        env_file = kwargs.get("env_file") or cls._hierarchy_env_files()
+        requested = [
+            Path(file).expanduser().absolute()
+            for file in (env_file if isinstance(env_file, list) else [env_file])
+        ]
+
+        snapshot = CompiledEnv.read(path)
+        if snapshot is None or not snapshot.is_current(requested):
+            return cls(**kwargs)
+
+        with cls._snapshot_lock:
+            PolyEnv._pending_snapshot = snapshot
+            try:
+                kwargs["env_file"] = [Path(file) for file in snapshot.files]
+                env = cls(**kwargs)
+                # A new instance takes the snapshot, so if it's still pending the instance existed
+                existing = PolyEnv._pending_snapshot is not None
+            finally:
+                PolyEnv._pending_snapshot = None
+
+        if existing:
+            msg = "Can't load a compiled snapshot after PolyEnv has been created"
+            raise RuntimeError(msg)
+
+        env._apply_snapshot(snapshot, path)
+        return env
+
+    def _apply_snapshot(self, snapshot: CompiledEnv, path: Path) -> None:
+        """Use a compiled snapshot's file values in place of finding and loading the files."""
+        self.env_file = [Path(file) for file in snapshot.files]
+        self._loaded = LoadedEnv(
+            values=dict(snapshot.file_values),
+            sources={name: Path(source) for name, source in snapshot.sources.items()},
+            signatures={Path(file): signature for file, signature in snapshot.files.items()},
+        )
+        if snapshot.secrets:  # Secret values aren't stored, so get them from the files again
+            secrets = self._read_secrets(snapshot)
+            if secrets is None:  # A secret refers to other variables, so merge every file again
+                self._loaded = load_env_files(self.env_file)
             else:
-                self.logger.debug("No env file found: %s", abs_path)
+                self._loaded.values.update(secrets)
+        apply_to_environ(self._loaded.values)
+        self.sources = dict(self._loaded.sources)
+        self.compiled_from = path
+        self.logger.debug(
+            "Loaded %s from compiled snapshot %s",
+            Text.plural("file value", len(self._loaded.values), with_count=True),
+            path,
+        )
 
-        if loaded_from and self.logger.isEnabledFor(10):  # DEBUG level
-            self.logger.debug("Environment variables loaded from:")
-            for var, source in sorted(loaded_from.items()):
-                self.logger.debug("  %s: %s", var, source)
+    @staticmethod
+    def _read_secrets(snapshot: CompiledEnv) -> dict[str, str] | None:
+        """Read the values of a snapshot's secrets, parsing only the files they came from.
 
-    def refresh(self) -> None:
-        """Reload environment variables from files and clear cached values."""
-        self._load_env_files()
-        self.values.clear()
-        self.logger.info("PolyEnv environment flushed and reloaded.")
+        Returns:
+            The secret values by name, or None if any of them can't be read on its own because it
+            refers to other variables, which would need every file merged to resolve.
+        """
+        values = {}
+        for name in snapshot.secrets:
+            source = snapshot.sources.get(name)
+            signature = snapshot.files.get(source) if source is not None else None
+            if source is None or signature is None:
+                return None
+            value = parse_env_file(Path(source), signature).get(name)
+            if value is None or "$" in value:
+                return None
+            values[name] = value
+        return values
+
+    def reload_changed(self) -> set[str]:
+        """Reload only the env files that changed, and invalidate only the variables they affect.
+
+        Unchanged files aren't parsed again, and if no file changed this is just one stat per file.
+        Variables whose raw value changed are updated in `os.environ` and dropped from the cache
+        of converted values, so they're converted again on next access while everything else stays
+        cached. A variable that was removed from the files is also removed from `os.environ`,
+        unless something else has changed it since it was loaded. Subscribers are notified with the
+        names of the variables that changed.
+
+        Returns:
+            The names of the variables whose values changed.
+        """
+        previous = self._loaded
+        changed_paths = changed_files(previous.signatures)
+        if not changed_paths:
+            return set()
+
+        loaded = load_env_files(previous.signatures)
+        old_values, new_values = previous.values, loaded.values
+        changed = {
+            key
+            for key in old_values.keys() | new_values.keys()
+            if old_values.get(key) != new_values.get(key)
+        }
+
+        for key in changed:
+            if key in new_values:
+                os.environ[key] = new_values[key]
+            elif os.environ.get(key) == old_values[key]:
+                del os.environ[key]
+            self.values.pop(key, None)
+
+        self.sources = loaded.sources
+        self._loaded = loaded
+        self.logger.debug(
+            "Reloaded %s: %s changed",
+            [str(path) for path in changed_paths],
+            Text.plural("variable", len(changed), with_count=True),
+        )
+
+        if changed:
+            for callback in list(self._subscribers):
+                try:
+                    callback(changed)
+                except Exception:
+                    self.logger.exception("Env change callback %r failed.", callback)
+
+        return changed
+
+    def subscribe(self, callback: Callable[[set[str]], None]) -> None:
+        """Register a function to call with the names of changed variables after a reload.
+
+        Args:
+            callback: A function that takes the set of variable names that changed.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[set[str]], None]) -> None:
+        """Stop calling a function registered with subscribe()."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def watch(self, interval: float = 1.0) -> None:
+        """Start watching the env files for changes on a background daemon thread.
+
+        The watcher polls each file's modification time and size every `interval` seconds, which
+        works the same on every platform and costs one stat per file. When a file changes, it calls
+        reload_changed(), so only the affected variables are invalidated and subscribers are
+        notified. Calling this again while already watching does nothing.
+
+        Args:
+            interval: How often to check the files, in seconds.
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        self._stop_watching.clear()
+
+        def poll() -> None:
+            while not self._stop_watching.wait(interval):
+                try:
+                    self.reload_changed()
+                except Exception:
+                    self.logger.exception("Failed to reload env files.")
+
+        self._watcher = threading.Thread(target=poll, name="polyenv-watcher", daemon=True)
+        self._watcher.start()
+        self.logger.debug("Watching env files every %ss.", interval)
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher started by watch(), if it's running."""
+        self._stop_watching.set()
+        if self._watcher is not None:
+            if self._watcher is not threading.current_thread():  # Called from a subscriber
+                self._watcher.join()
+            self._watcher = None
 
     def validate_all(self) -> None:
         """Validate all registered environment variables at once.
@@ -169,17 +447,104 @@ class PolyEnv(metaclass=Singleton):
         Raises:
             ValueError: With a summary of all missing or invalid variables.
         """
+        self._get_validated(self.vars)
+
+    def _get_validated(self, names: Iterable[str]) -> dict[str, Any]:
+        """Get the values of the given variables, reporting every failure at once.
+
+        Raises:
+            ValueError: With a summary of all missing or invalid variables.
+        """
+        values = {}
         errors = []
 
-        for name in self.vars:
+        for name in names:
             try:
-                self.get(name)
+                values[name] = self.get(name)
             except (ValueError, KeyError) as e:
                 errors.append(f"{name}: {e}")
 
         if errors:
             msg = "Environment validation failed:\n- " + "\n- ".join(errors)
             raise ValueError(msg)
+        return values
+
+    def freeze(self, schema: type[T] | None = None) -> T | FrozenEnv:
+        """Validate every variable once and return an immutable object with plain attributes.
+
+        Reading an attribute of the result is a single attribute lookup, which makes it the fastest
+        way to read configuration in hot paths. The values are fixed at the time of freezing.
+
+        Without a schema, the result is a slotted `FrozenEnv` with an attribute for every
+        registered variable. With a dataclass schema, each field is filled from the variable with
+        that attribute name, or from the uppercase field name if it isn't registered yet. Missing
+        variables are registered from the field: its annotation is the type, its default (if any)
+        makes it optional, and `field(metadata={"secret": True, "description": "..."})` sets the
+        rest. Declare the schema with `@dataclass(frozen=True, slots=True)` for an immutable,
+        slotted result.
+
+        Args:
+            schema: An optional dataclass to create instead of a `FrozenEnv`.
+
+        Returns:
+            The frozen configuration.
+
+        Raises:
+            TypeError: If the schema isn't a dataclass, or a field's type has no clear converter.
+            ValueError: If any of the variables are missing or invalid, or without a schema, if a
+                variable's attribute name is one FrozenEnv uses itself, like `as_dict`.
+        """
+        if schema is None:
+            values = self._get_validated(self.vars)
+            secrets = [attr for attr, name in self.attr_names.items() if self.vars[name].secret]
+            return freeze_values(
+                {attr: values[name] for attr, name in self.attr_names.items()}, secrets
+            )
+
+        if not dataclasses.is_dataclass(schema):
+            msg = f"Schema must be a dataclass, not {schema!r}"
+            raise TypeError(msg)
+
+        try:
+            hints = get_type_hints(schema)
+        except (NameError, TypeError):  # Annotations that can't be resolved are treated as str
+            hints = {}
+
+        names = {}
+        for schema_field in dataclasses.fields(schema):
+            if not schema_field.init:
+                continue
+            name = self.attr_names.get(schema_field.name, schema_field.name.upper())
+            if name not in self.vars:
+                self._add_schema_var(name, schema_field, hints.get(schema_field.name, str))
+            names[schema_field.name] = name
+
+        values = self._get_validated(names.values())
+        return schema(**{attr: values[name] for attr, name in names.items()})
+
+    def _add_schema_var(self, name: str, schema_field: dataclasses.Field, hint: Any) -> None:
+        """Register a variable for a schema field that doesn't have one yet."""
+        converter = field_converter(hint, self.validate_bool)
+        required = False
+        if schema_field.default is not dataclasses.MISSING:
+            default = schema_field.default
+        elif schema_field.default_factory is not dataclasses.MISSING:
+            default = schema_field.default_factory()
+        else:
+            default, required = "", True
+
+        if default is None:  # Optional fields convert an unset variable to None
+            default, converter = "", _none_if_empty(converter)
+
+        self.add_var(
+            name=name,
+            attr_name=schema_field.name,
+            required=required,
+            default=default,
+            var_type=converter,
+            description=schema_field.metadata.get("description", ""),
+            secret=schema_field.metadata.get("secret", False),
+        )
 
     def add_var(
         self,
@@ -219,7 +584,7 @@ class PolyEnv(metaclass=Singleton):
         attr = attr_name or name.lower()
         self.attr_names[attr] = name
 
-        self.vars[name] = PolyVar(
+        var = PolyVar(
             name=name.upper(),
             required=required,
             default=default,
@@ -227,6 +592,8 @@ class PolyEnv(metaclass=Singleton):
             description=description,
             secret=secret,
         )
+        self.vars[name] = var
+        self._converted.pop(name, None)  # Don't reuse a conversion made with the old definition
 
     def add_vars(self, *vars: PolyVar) -> None:  # noqa: A002
         """Add multiple environment variables at once.
@@ -309,6 +676,10 @@ class PolyEnv(metaclass=Singleton):
     def get(self, name: str, default: Any | None = None) -> Any:
         """Get the value of an environment variable.
 
+        Converted values are cached, and a cached value is only used while `os.environ` still
+        holds the raw value it was converted from, so changes made to the environment at runtime
+        are picked up on the next read.
+
         Args:
             name: The environment variable name
             default: Override default value (takes precedence over registered default)
@@ -321,14 +692,20 @@ class PolyEnv(metaclass=Singleton):
             msg = f"Unknown environment variable: {name}"
             raise KeyError(msg)
 
-        # Return the cached value first if we have it
-        if name in self.values:
-            return self.values[name]
+        # Values overridden in the current context take precedence over everything
+        overrides = self._context_overrides()
+        if overrides is not None and name in overrides:
+            return overrides[name]
 
-        var = self.vars[name]
+        # Return the cached value if the environment still has the value it was converted from.
+        # Look it up only once, since reload_changed() may drop it from another thread meanwhile.
+        environ_value = os.environ.get(name)
+        cached = self.values.get(name, _MISSING)
+        if cached is not _MISSING and self._environ_values.get(name) == environ_value:
+            return cached
 
-        # Try to get the value from the environment
-        value = os.environ.get(name)
+        var = self.vars[name]
+        value = environ_value
 
         # Determine the final value using clear priority order
         if value is not None:
@@ -349,15 +726,97 @@ class PolyEnv(metaclass=Singleton):
             # Non-required var with no default
             return None
 
-        # Convert the value
+        converted = self._convert_if_changed(name, var, value)
+        self.values[name] = converted
+        self._environ_values[name] = environ_value
+        return converted
+
+    def _convert_if_changed(self, name: str, var: PolyVar, value: Any) -> Any:
+        """Convert a raw value, reusing the last conversion if the raw value hasn't changed.
+
+        Raises:
+            ValueError: If the value can't be converted.
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = ConversionStats()
+
+        previous = self._converted.get(name)
+        if previous is not None and previous[0] == value:
+            stats.reused += 1
+            return previous[1]
+
+        try:
+            converted = self._convert(var, value)
+        except ValueError:
+            stats.failures += 1
+            raise
+        stats.conversions += 1
+        self._converted[name] = (value, converted)
+        return converted
+
+    def conversion_stats(self) -> dict[str, ConversionStats]:
+        """Get how often each variable has been converted, or reused its previous conversion.
+
+        Cached reads aren't counted, only reads after the cache was invalidated (by `refresh()`,
+        `reload_changed()` and the like), which is where conversions can be saved.
+
+        Returns:
+            A copy of the counts, by variable name.
+        """
+        return {name: dataclasses.replace(stats) for name, stats in self._stats.items()}
+
+    @staticmethod
+    def _convert(var: PolyVar, value: Any) -> Any:
+        """Convert a raw value with the variable's type.
+
+        Raises:
+            ValueError: If the value can't be converted.
+        """
         try:
-            converted = var.var_type(value)
-            self.values[name] = converted
-            return converted
+            return var.var_type(value)
         except Exception as e:
-            msg = f"Invalid value for {name}: {e!s}"
+            msg = f"Invalid value for {var.name}: {e!s}"
             raise ValueError(msg) from e
 
+    @contextmanager
+    def override(self, **values: Any) -> Iterator[None]:
+        """Override variables for the current context only, such as in a test or for one tenant.
+
+        Overrides are layered over the cached values with a context variable, so they're visible
+        only to the current thread or asyncio task (and tasks it starts), and nothing else is
+        changed or recomputed. Blocks can be nested, with inner overrides taking precedence.
+
+        Variables are given by name or attribute name. Strings are converted with the variable's
+        type as if they came from the environment; other values are used as given.
+
+            with env.override(MAX_CONNECTIONS=50, debug_mode="true"):
+                assert env.max_connections == 50
+
+        Raises:
+            KeyError: If a variable isn't registered.
+            ValueError: If a string value can't be converted.
+        """
+        layers = _overrides.get() or {}
+        layer = dict(layers.get(id(self), {}))
+        for key, value in values.items():
+            name = key if key in self.vars else self.attr_names.get(key)
+            if name is None:
+                msg = f"Unknown environment variable: {key}"
+                raise KeyError(msg)
+            layer[name] = self._convert(self.vars[name], value) if isinstance(value, str) else value
+
+        token = _overrides.set({**layers, id(self): layer})
+        try:
+            yield
+        finally:
+            _overrides.reset(token)
+
+    def _context_overrides(self) -> Mapping[str, Any] | None:
+        """Get the values overridden for this instance in the current context, if any."""
+        layers = _overrides.get()
+        return layers.get(id(self)) if layers else None
+
     def __getattr__(self, name: str) -> Any:
         """Allow accessing variables as attributes.
 
@@ -415,3 +874,12 @@ class PolyEnv(metaclass=Singleton):
             f"Valid false values: {', '.join(sorted(false_values))}."
         )
         raise ValueError(msg)
+
+
+def _none_if_empty(converter: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Wrap a converter to return None for an empty value instead of converting it."""
+
+    def convert(value: str) -> Any:
+        return None if value == "" else converter(value)
+
+    return convert
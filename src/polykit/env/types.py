@@ -35,3 +35,18 @@ class PolyVar:
         if not self.required and self.default is None:
             msg = f"Non-required variable {self.name} must have a default value"
             raise ValueError(msg)
+
+
+@dataclass
+class ConversionStats:
+    """Counts of how a variable's converted value was produced.
+
+    Args:
+        conversions: How many times the raw value was converted.
+        reused: How many times a previous conversion was reused because the raw value was unchanged.
+        failures: How many conversions failed.
+    """
+
+    conversions: int = 0
+    reused: int = 0
+    failures: int = 0
@@ -0,0 +1,175 @@
+"""Content-addressed cache of diff results, in memory with optional on-disk persistence."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from polykit.core.json_store import JSONStore
+from polykit.files.types import DiffResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from polykit.files.types import Hunk
+
+# Identifies the diff algorithm, so entries computed differently are never mixed up
+DIFF_ALGORITHM = "linehash-difflib-1"
+
+
+class DiffCache:
+    """Content-addressed cache for PolyDiff results.
+
+    Entries are keyed by the hashes of both inputs plus everything else that affects the result:
+    the diff style, the diff algorithm, whether it's a stats-only diff, and the header labels. Only
+    the hunk offsets and line counts are stored, never the text itself, and results are rebuilt
+    against the caller's own lines on a hit. That keeps entries small and makes the on-disk format
+    plain JSON.
+
+    The in-memory tier evicts the least recently used entries beyond `max_entries`. If `directory`
+    is given, entries are also written there so they survive across runs and can be shared between
+    hosts, and the oldest files are pruned once there are more than `max_disk_entries`.
+
+    Args:
+        max_entries: The maximum number of entries to keep in memory.
+        directory: An optional directory to persist entries in.
+        max_disk_entries: The maximum number of entries to keep on disk.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        directory: str | Path | None = None,
+        max_disk_entries: int = 4096,
+    ):
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._store = (
+            JSONStore(self.directory, max_disk_entries) if self.directory is not None else None
+        )
+
+    @classmethod
+    def on_disk(cls, app_name: str = "polykit", **kwargs: Any) -> DiffCache:
+        """Create a cache persisted in the PolyPaths cache directory for the given app.
+
+        Args:
+            app_name: The application name used to locate the cache directory.
+            **kwargs: Additional arguments for the DiffCache constructor.
+        """
+        return cls(directory=JSONStore.app_cache_dir(app_name, "diffs"), **kwargs)
+
+    @staticmethod
+    def make_key(old: str, new: str, **params: Any) -> str:
+        """Build a cache key from both inputs and the parameters that affect the result.
+
+        Args:
+            old: The original content.
+            new: The new content.
+            **params: Any other parameters that affect the result, such as style and headers.
+
+        Returns:
+            A hex digest identifying this comparison.
+        """
+        old_hash = hashlib.blake2b(old.encode("utf-8"), digest_size=16).hexdigest()
+        new_hash = hashlib.blake2b(new.encode("utf-8"), digest_size=16).hexdigest()
+        settings = json.dumps({"algorithm": DIFF_ALGORITHM, **params}, sort_keys=True, default=str)
+        return hashlib.blake2b(
+            f"{old_hash}:{new_hash}:{settings}".encode(), digest_size=20
+        ).hexdigest()
+
+    def get(
+        self,
+        key: str,
+        old_lines: Sequence[str],
+        new_lines: Sequence[str],
+        fromfile: str = "current",
+        tofile: str = "new",
+    ) -> DiffResult | None:
+        """Look up a result, rebuilding it against the given lines.
+
+        Args:
+            key: The cache key from make_key().
+            old_lines: The original lines, including line endings.
+            new_lines: The new lines, including line endings.
+            fromfile: The label for the original side in the diff header.
+            tofile: The label for the new side in the diff header.
+
+        Returns:
+            The cached DiffResult, or None if there is no entry for this key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and self._store is not None and (entry := self._store.read(key)):
+            self._remember(key, entry)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._to_result(entry, old_lines, new_lines, fromfile, tofile)
+
+    def put(self, key: str, result: DiffResult) -> None:
+        """Store a result under the given key."""
+        entry = {
+            "has_changes": result.has_changes,
+            "lines_added": result.lines_added,
+            "lines_removed": result.lines_removed,
+            "hunks": [[list(op) for op in hunk] for hunk in result.hunks]
+            if not result.stats_only
+            else None,
+        }
+        self._remember(key, entry)
+        if self._store is not None:
+            self._store.write(key, entry)
+
+    def clear(self) -> None:
+        """Remove all entries, including those on disk."""
+        with self._lock:
+            self._entries.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        """Add an entry to the in-memory tier, evicting the least recently used if needed."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _to_result(
+        entry: dict[str, Any],
+        old_lines: Sequence[str],
+        new_lines: Sequence[str],
+        fromfile: str,
+        tofile: str,
+    ) -> DiffResult:
+        """Rebuild a DiffResult from a stored entry."""
+        if not entry["has_changes"]:
+            return DiffResult(False, [], [], [])
+        if entry["hunks"] is None:
+            return DiffResult(
+                True, lines_added=entry["lines_added"], lines_removed=entry["lines_removed"]
+            )
+        hunks: list[Hunk] = [
+            [(op[0], op[1], op[2], op[3], op[4]) for op in hunk] for hunk in entry["hunks"]
+        ]
+        return DiffResult.from_hunks(old_lines, new_lines, hunks, fromfile, tofile)
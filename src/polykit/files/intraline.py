@@ -0,0 +1,128 @@
+"""Intra-line highlighting of the words or characters that changed between paired diff lines."""
+
+from __future__ import annotations
+
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from polykit.colors import Styles
+from polykit.files.types import IntralineMode
+
+# Turns reverse video off without resetting the surrounding log level color
+REVERSE_OFF = "\033[27m"
+
+# Words, runs of whitespace, and individual punctuation characters
+WORD_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+@lru_cache(maxsize=4096)
+def tokenize(line: str, mode: IntralineMode) -> tuple[str, ...]:
+    """Split a line into tokens for intra-line comparison.
+
+    Results are cached per line (keyed by its hash), so lines that show up repeatedly across hunks
+    or across diffs are only tokenized once.
+
+    Args:
+        line: The line to tokenize, without its line ending.
+        mode: Whether to split into words or individual characters.
+
+    Returns:
+        A tuple of tokens that join back into the original line.
+    """
+    if mode == IntralineMode.CHAR:
+        return tuple(line)
+    return tuple(WORD_PATTERN.findall(line))
+
+
+class IntralineHighlighter:
+    """Pair up changed lines and highlight the words or characters that differ within them.
+
+    Instances are callable with the old and new lines of a replaced block, which is the form
+    DiffResult.iter_lines() expects for its `highlighter` argument. Lines are paired in order, and
+    lines over `max_length` characters are left as they are to avoid pathological matching cost.
+
+    Args:
+        mode: Whether to compare words or individual characters.
+        max_length: Lines longer than this are not highlighted.
+        min_ratio: Pairs less similar than this are not highlighted, since nearly every token
+                   would be marked anyway.
+        start: The escape sequence that starts a highlighted span.
+        end: The escape sequence that ends a highlighted span.
+    """
+
+    def __init__(
+        self,
+        mode: IntralineMode | str = IntralineMode.WORD,
+        max_length: int = 1000,
+        min_ratio: float = 0.3,
+        start: str = Styles.REVERSE,
+        end: str = REVERSE_OFF,
+    ):
+        self.mode = IntralineMode(mode)
+        self.max_length = max_length
+        self.min_ratio = min_ratio
+        self.start = start
+        self.end = end
+
+    def __call__(self, old_block: list[str], new_block: list[str]) -> tuple[list[str], list[str]]:
+        """Highlight the paired lines of a replaced block.
+
+        Args:
+            old_block: The removed lines, including line endings.
+            new_block: The added lines, including line endings.
+
+        Returns:
+            The old and new blocks, with changed spans of paired lines highlighted.
+        """
+        old_out, new_out = list(old_block), list(new_block)
+        for index in range(min(len(old_block), len(new_block))):
+            old_line, new_line = self.highlight_pair(old_block[index], new_block[index])
+            old_out[index], new_out[index] = old_line, new_line
+        return old_out, new_out
+
+    def highlight_pair(self, old_line: str, new_line: str) -> tuple[str, str]:
+        """Highlight the differences between a single pair of lines.
+
+        Args:
+            old_line: The removed line, including its line ending.
+            new_line: The added line, including its line ending.
+
+        Returns:
+            The old and new lines with changed spans highlighted, or unchanged if the pair is too
+            long or too dissimilar to be worth highlighting.
+        """
+        old_text, old_ending = self._split_ending(old_line)
+        new_text, new_ending = self._split_ending(new_line)
+
+        if len(old_text) > self.max_length or len(new_text) > self.max_length:
+            return old_line, new_line
+
+        old_tokens = tokenize(old_text, self.mode)
+        new_tokens = tokenize(new_text, self.mode)
+        matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+
+        if matcher.ratio() < self.min_ratio:
+            return old_line, new_line
+
+        old_parts: list[str] = []
+        new_parts: list[str] = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            old_segment = "".join(old_tokens[i1:i2])
+            new_segment = "".join(new_tokens[j1:j2])
+            if tag == "equal":
+                old_parts.append(old_segment)
+                new_parts.append(new_segment)
+                continue
+            if old_segment:
+                old_parts.append(f"{self.start}{old_segment}{self.end}")
+            if new_segment:
+                new_parts.append(f"{self.start}{new_segment}{self.end}")
+
+        return "".join(old_parts) + old_ending, "".join(new_parts) + new_ending
+
+    @staticmethod
+    def _split_ending(line: str) -> tuple[str, str]:
+        """Split a line into its text and its line ending."""
+        text = line.rstrip("\r\n")
+        return text, line[len(text) :]
@@ -0,0 +1,36 @@
+"""Line-hash matching core shared by PolyDiff's diff, merge and patch operations."""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def intern_lines(*sequences: Sequence[str]) -> list[list[int]]:
+    """Map every line to a small integer ID that is shared across all the given sequences.
+
+    Equal lines get equal IDs, so matching only ever hashes and compares integers instead of full
+    lines. Each distinct line is hashed once no matter how many sequences it appears in, which is
+    what makes comparing one base against several revisions cheap.
+
+    Args:
+        *sequences: The line sequences to intern.
+
+    Returns:
+        A list of ID sequences, in the same order as the input sequences.
+    """
+    ids: dict[str, int] = {}
+    return [[ids.setdefault(line, len(ids)) for line in seq] for seq in sequences]
+
+
+def line_matcher(old_lines: Sequence[str], new_lines: Sequence[str]) -> SequenceMatcher[int]:
+    """Create a SequenceMatcher over the interned IDs of two line sequences.
+
+    The opcodes and matching blocks it produces are identical to matching the lines directly, and
+    index straight into the original sequences.
+    """
+    old_ids, new_ids = intern_lines(old_lines, new_lines)
+    return SequenceMatcher(None, old_ids, new_ids)
@@ -0,0 +1,169 @@
+"""Three-way line merging built on the shared line-hash matching core."""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING
+
+from polykit.files.matching import intern_lines
+from polykit.files.types import MergeConflict, MergeResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+# A region produced by Merge3.merge_regions(), tagged with how it should be resolved
+MergeRegion = tuple[str, int, int, int, int, int, int]
+
+
+class Merge3:
+    """Merge two revisions of a text against their common base.
+
+    All three sequences are interned together so each distinct line is hashed once, and the base is
+    matched against each side with a single SequenceMatcher pass. Regions where only one side
+    changed take that side; regions where both sides made the same change take it once; everything
+    else becomes a conflict.
+
+    Args:
+        base: The lines of the common ancestor, including line endings.
+        ours: The lines of our revision, including line endings.
+        theirs: The lines of their revision, including line endings.
+    """
+
+    def __init__(self, base: Sequence[str], ours: Sequence[str], theirs: Sequence[str]):
+        self.base, self.ours, self.theirs = base, ours, theirs
+        self._base_ids, self._ours_ids, self._theirs_ids = intern_lines(base, ours, theirs)
+
+    def find_sync_regions(self) -> list[tuple[int, int, int, int, int, int]]:
+        """Find the base regions that are unchanged on both sides.
+
+        Returns:
+            A list of (base_start, base_end, ours_start, ours_end, theirs_start, theirs_end) tuples,
+            terminated by an empty region at the end of all three sequences.
+        """
+        ours_blocks = SequenceMatcher(None, self._base_ids, self._ours_ids).get_matching_blocks()
+        theirs_blocks = SequenceMatcher(
+            None, self._base_ids, self._theirs_ids
+        ).get_matching_blocks()
+
+        regions = []
+        o_index = t_index = 0
+        while o_index < len(ours_blocks) and t_index < len(theirs_blocks):
+            o_base, o_match, o_len = ours_blocks[o_index]
+            t_base, t_match, t_len = theirs_blocks[t_index]
+
+            # Find where the two matching blocks overlap in the base
+            start = max(o_base, t_base)
+            end = min(o_base + o_len, t_base + t_len)
+            if start < end:
+                ours_start = o_match + (start - o_base)
+                theirs_start = t_match + (start - t_base)
+                regions.append(
+                    (
+                        start,
+                        end,
+                        ours_start,
+                        ours_start + end - start,
+                        theirs_start,
+                        theirs_start + end - start,
+                    )
+                )
+
+            # Advance whichever block ends first
+            if o_base + o_len < t_base + t_len:
+                o_index += 1
+            else:
+                t_index += 1
+
+        base_len, ours_len, theirs_len = len(self.base), len(self.ours), len(self.theirs)
+        regions.append((base_len, base_len, ours_len, ours_len, theirs_len, theirs_len))
+        return regions
+
+    def merge_regions(self) -> Iterator[MergeRegion]:
+        """Yield the regions of the merge and how each one resolves.
+
+        Each region is (kind, base_start, base_end, ours_start, ours_end, theirs_start, theirs_end),
+        where kind is "unchanged", "same", "ours", "theirs" or "conflict".
+        """
+        base_ids, ours_ids, theirs_ids = self._base_ids, self._ours_ids, self._theirs_ids
+        b_pos = o_pos = t_pos = 0
+
+        for b_match, b_end, o_match, o_end, t_match, t_end in self.find_sync_regions():
+            if o_match > o_pos or t_match > t_pos or b_match > b_pos:
+                base_chunk = base_ids[b_pos:b_match]
+                ours_chunk = ours_ids[o_pos:o_match]
+                theirs_chunk = theirs_ids[t_pos:t_match]
+                region = (b_pos, b_match, o_pos, o_match, t_pos, t_match)
+
+                if ours_chunk == theirs_chunk:
+                    yield ("same", *region)
+                elif ours_chunk == base_chunk:
+                    yield ("theirs", *region)
+                elif theirs_chunk == base_chunk:
+                    yield ("ours", *region)
+                else:
+                    yield ("conflict", *region)
+
+            if b_end > b_match:
+                yield ("unchanged", b_match, b_end, o_match, o_end, t_match, t_end)
+
+            b_pos, o_pos, t_pos = b_end, o_end, t_end
+
+    def merge(
+        self,
+        ours_label: str = "ours",
+        theirs_label: str = "theirs",
+        base_label: str | None = None,
+    ) -> MergeResult:
+        """Merge the revisions, marking conflicts with Git-style conflict markers.
+
+        Args:
+            ours_label: The label to show after the opening conflict marker.
+            theirs_label: The label to show after the closing conflict marker.
+            base_label: If given, include the base lines in each conflict (diff3 style).
+
+        Returns:
+            A MergeResult with the merged text and a list of conflicts.
+        """
+        merged: list[str] = []
+        conflicts: list[MergeConflict] = []
+
+        for kind, b_start, b_end, o_start, o_end, t_start, t_end in self.merge_regions():
+            if kind in {"unchanged", "same", "ours"}:
+                merged.extend(self.ours[o_start:o_end])
+            elif kind == "theirs":
+                merged.extend(self.theirs[t_start:t_end])
+            else:
+                ours = list(self.ours[o_start:o_end])
+                theirs = list(self.theirs[t_start:t_end])
+                base = list(self.base[b_start:b_end])
+                merged_start = len(merged)
+
+                merged.append(f"<<<<<<< {ours_label}\n")
+                merged.extend(self._terminated(ours))
+                if base_label is not None:
+                    merged.append(f"||||||| {base_label}\n")
+                    merged.extend(self._terminated(base))
+                merged.append("=======\n")
+                merged.extend(self._terminated(theirs))
+                merged.append(f">>>>>>> {theirs_label}\n")
+
+                conflicts.append(
+                    MergeConflict(
+                        base_range=(b_start, b_end),
+                        ours_range=(o_start, o_end),
+                        theirs_range=(t_start, t_end),
+                        merged_range=(merged_start, len(merged)),
+                        base=base,
+                        ours=ours,
+                        theirs=theirs,
+                    )
+                )
+
+        return MergeResult("".join(merged), conflicts)
+
+    @staticmethod
+    def _terminated(lines: list[str]) -> list[str]:
+        """Ensure the last line ends with a newline so the next conflict marker starts cleanly."""
+        if lines and not lines[-1].endswith(("\n", "\r")):
+            return [*lines[:-1], f"{lines[-1]}\n"]
+        return lines
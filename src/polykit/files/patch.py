@@ -0,0 +1,295 @@
+"""Parse unified diffs and apply them in-process with offset and fuzz tolerance."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from polykit.files.types import HunkOutcome, split_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+NO_NEWLINE_MARKER = "\\ No newline at end of file"
+DEV_NULL = "/dev/null"
+
+
+@dataclass
+class PatchHunk:
+    """A single hunk of a unified diff.
+
+    Args:
+        old_start: The 1-based starting line in the original file.
+        old_len: The number of original lines the hunk covers.
+        new_start: The 1-based starting line in the new file.
+        new_len: The number of new lines the hunk covers.
+        lines: The hunk body, each line prefixed with " ", "-" or "+".
+    """
+
+    old_start: int
+    old_len: int
+    new_start: int
+    new_len: int
+    lines: list[str] = field(default_factory=list)
+
+
+@dataclass
+class FilePatch:
+    """All hunks of a unified diff that apply to a single file."""
+
+    old_path: str | None = None
+    new_path: str | None = None
+    hunks: list[PatchHunk] = field(default_factory=list)
+
+    @property
+    def is_new_file(self) -> bool:
+        """Whether the patch creates the file."""
+        return self.old_path == DEV_NULL
+
+    @property
+    def is_deleted_file(self) -> bool:
+        """Whether the patch deletes the file."""
+        return self.new_path == DEV_NULL
+
+    def target(self, strip: int = 0) -> str | None:
+        """Get the path the patch applies to, with `strip` leading components removed."""
+        path = self.old_path if self.is_deleted_file or not self.new_path else self.new_path
+        if path is None or path == DEV_NULL:
+            return None
+        parts = Path(path).parts
+        return str(Path(*parts[strip:])) if len(parts) > strip else None
+
+
+def parse_patch(diff: str | Iterable[str]) -> list[FilePatch]:
+    """Parse a unified diff, which may cover several files, into file patches.
+
+    Lines may be given with or without line endings. If no line has an ending at all (for example,
+    the rstripped `DiffResult.changes`), every line is treated as newline-terminated. Otherwise a
+    missing ending marks the last line of a file that has no trailing newline, as in the raw output
+    of `DiffResult.iter_lines()`.
+
+    Args:
+        diff: The unified diff text or its lines.
+
+    Returns:
+        A list of FilePatch objects in the order they appear in the diff.
+
+    Raises:
+        ValueError: If a hunk is malformed.
+    """
+    lines = split_lines(diff) if isinstance(diff, str) else list(diff)
+    if lines and not any(line.endswith(("\n", "\r")) for line in lines):
+        lines = [f"{line}\n" for line in lines]
+
+    patches: list[FilePatch] = []
+    current: FilePatch | None = None
+    index = 0
+
+    while index < len(lines):
+        line = lines[index]
+
+        next_line = lines[index + 1] if index + 1 < len(lines) else ""
+        if line.startswith("--- ") and next_line.startswith("+++ "):
+            current = FilePatch(_header_path(line), _header_path(next_line))
+            patches.append(current)
+            index += 2
+            continue
+
+        if match := HUNK_HEADER.match(line):
+            if current is None:  # Bare hunks without file headers
+                current = FilePatch()
+                patches.append(current)
+            hunk, index = _parse_hunk(match, lines, index + 1)
+            current.hunks.append(hunk)
+            continue
+
+        index += 1  # Skip anything else, like "diff --git" or "index" lines
+
+    return patches
+
+
+def _header_path(line: str) -> str:
+    """Extract the path from a ---/+++ header line, dropping any timestamp."""
+    return line[4:].rstrip("\r\n").split("\t")[0].strip()
+
+
+def _parse_hunk(match: re.Match[str], lines: list[str], index: int) -> tuple[PatchHunk, int]:
+    """Parse the body of a hunk starting at `index`.
+
+    Returns:
+        The parsed hunk and the index of the first line after it.
+
+    Raises:
+        ValueError: If the hunk body is shorter than its header says.
+    """
+    old_start, old_len, new_start, new_len = (
+        int(value) if value is not None else 1 for value in match.groups()
+    )
+    hunk = PatchHunk(old_start, old_len, new_start, new_len)
+    old_seen = new_seen = 0
+
+    while index < len(lines) and (old_seen < old_len or new_seen < new_len):
+        line = lines[index]
+        if line.startswith("\\"):  # No newline marker for the previous line
+            if hunk.lines:
+                hunk.lines[-1] = hunk.lines[-1].rstrip("\r\n")
+            index += 1
+            continue
+
+        prefix = line[:1]
+        if prefix in {"", "\n", "\r"}:  # Blank context line with its leading space stripped
+            line, prefix = f" {line}", " "
+        if prefix not in {" ", "-", "+"}:
+            break
+
+        hunk.lines.append(line)
+        old_seen += prefix != "+"
+        new_seen += prefix != "-"
+        index += 1
+
+    if old_seen != old_len or new_seen != new_len:
+        msg = f"Malformed hunk at line {old_start}: expected {old_len}/{new_len} lines."
+        raise ValueError(msg)
+
+    # A trailing marker belongs to the last line of this hunk
+    if index < len(lines) and lines[index].startswith(NO_NEWLINE_MARKER[:2]):
+        hunk.lines[-1] = hunk.lines[-1].rstrip("\r\n")
+        index += 1
+
+    return hunk, index
+
+
+class PatchApplier:
+    """Apply the hunks of a file patch to a list of lines.
+
+    Each hunk is first tried at its stated position, adjusted by the drift of previous hunks, then
+    at increasing distances from it. Candidate positions come from an index of where each line
+    occurs, so searching does not rescan the file. If no exact match is found, up to `fuzz` lines of
+    leading and trailing context are ignored, like `patch --fuzz`.
+
+    Args:
+        fuzz: The maximum number of context lines that may be ignored at each end of a hunk.
+        max_offset: The maximum distance from the stated position to search, or None for no limit.
+    """
+
+    def __init__(self, fuzz: int = 2, max_offset: int | None = None):
+        self.fuzz = fuzz
+        self.max_offset = max_offset
+
+    def apply(self, original: list[str], hunks: list[PatchHunk]) -> tuple[str, list[HunkOutcome]]:
+        """Apply hunks in order to the original lines.
+
+        Args:
+            original: The original lines, including line endings.
+            hunks: The hunks to apply.
+
+        Returns:
+            The patched text and the outcome of each hunk.
+        """
+        keys = [line.rstrip("\r\n") for line in original]
+        positions: dict[str, list[int]] = {}
+        for position, key in enumerate(keys):
+            positions.setdefault(key, []).append(position)
+
+        output: list[str] = []
+        outcomes: list[HunkOutcome] = []
+        cursor = drift = 0
+
+        for hunk_index, hunk in enumerate(hunks):
+            found = self._locate(hunk, keys, positions, cursor, drift)
+            if found is None:
+                outcomes.append(HunkOutcome(hunk_index, applied=False))
+                continue
+
+            position, body, fuzz, offset = found
+            output.extend(original[cursor:position])
+
+            # Keep the file's own context lines so their line endings are preserved
+            source = position
+            for line in body:
+                prefix = line[0]
+                if prefix == " ":
+                    output.append(original[source])
+                    source += 1
+                elif prefix == "-":
+                    source += 1
+                else:
+                    output.append(line[1:])
+
+            outcomes.append(HunkOutcome(hunk_index, True, offset, fuzz))
+            drift += offset
+            cursor = source
+
+        output.extend(original[cursor:])
+        return "".join(output), outcomes
+
+    def _locate(
+        self,
+        hunk: PatchHunk,
+        keys: list[str],
+        positions: dict[str, list[int]],
+        cursor: int,
+        drift: int,
+    ) -> tuple[int, list[str], int, int] | None:
+        """Find where a hunk applies, trying more fuzz only when an exact match isn't found.
+
+        Returns:
+            The position, the (possibly trimmed) hunk body, the fuzz used and the offset from the
+            expected position, or None if the hunk doesn't apply.
+        """
+        lead = _count_context(hunk.lines)
+        tail = _count_context(reversed(hunk.lines))
+        expected = (hunk.old_start - 1 if hunk.old_len else hunk.old_start) + drift
+
+        for fuzz in range(self.fuzz + 1):
+            trim_lead, trim_tail = min(fuzz, lead), min(fuzz, tail)
+            if fuzz and not (trim_lead or trim_tail):
+                break  # Nothing left to trim, so more fuzz can't help
+            if trim_lead + trim_tail >= len(hunk.lines):
+                break
+
+            body = hunk.lines[trim_lead : len(hunk.lines) - trim_tail]
+            old = [line[1:].rstrip("\r\n") for line in body if line[0] != "+"]
+            position = self._search(old, keys, positions, cursor, expected + trim_lead)
+            if position is not None:
+                return position, body, fuzz, position - (expected + trim_lead)
+
+        return None
+
+    def _search(
+        self,
+        old: list[str],
+        keys: list[str],
+        positions: dict[str, list[int]],
+        cursor: int,
+        expected: int,
+    ) -> int | None:
+        """Find the closest position at or after `cursor` where `old` matches the file."""
+        expected = max(cursor, min(expected, len(keys)))
+        if not old:  # Pure insertion, so it goes exactly where it says
+            return expected
+
+        size = len(old)
+        candidates = [
+            position
+            for position in positions.get(old[0], [])
+            if cursor <= position <= len(keys) - size
+            and (self.max_offset is None or abs(position - expected) <= self.max_offset)
+        ]
+        for position in sorted(candidates, key=lambda pos: (abs(pos - expected), pos)):
+            if keys[position : position + size] == old:
+                return position
+        return None
+
+
+def _count_context(lines: Iterable[str]) -> int:
+    """Count the context lines at the start of a hunk body."""
+    count = 0
+    for line in lines:
+        if line[0] != " ":
+            break
+        count += 1
+    return count
@@ -1,19 +1,45 @@
 from __future__ import annotations
 
-from difflib import unified_diff
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from polykit.files.types import DiffResult, DiffStyle
+from polykit.files.intraline import IntralineHighlighter
+from polykit.files.matching import line_matcher
+from polykit.files.merge import Merge3
+from polykit.core.atomic import write_atomic
+from polykit.files.patch import FilePatch, PatchApplier, parse_patch
+from polykit.files.structured import compare_trees, hash_tree, parse
+from polykit.files.types import (
+    DiffResult,
+    DiffStyle,
+    HunkOutcome,
+    IntralineMode,
+    MergeResult,
+    PatchResult,
+    StructuredDiffResult,
+    StructuredFormat,
+    count_opcodes,
+    normalize_diff_line,
+    split_lines,
+)
 from polykit.log import PolyLog
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from logging import Logger
 
+    from polykit.files.cache import DiffCache
+
 
 class PolyDiff:
     """A utility class with a set of methods to compare files and show differences."""
 
+    # Changed lines longer than this are shown without intra-line highlighting
+    INTRALINE_MAX_LENGTH: ClassVar[int] = 1000
+
+    # Cache used by content() and files() when no cache is passed explicitly
+    cache: ClassVar[DiffCache | None] = None
+
     @classmethod
     def files(
         cls,
@@ -21,6 +47,9 @@ class PolyDiff:
         new_path: str | Path,
         style: DiffStyle = DiffStyle.COLORED,
         logger: Logger | None = None,
+        stats_only: bool = False,
+        intraline: IntralineMode | str | None = None,
+        cache: DiffCache | None = None,
     ) -> DiffResult:
         """Show diff between two files.
 
@@ -29,6 +58,11 @@ class PolyDiff:
             new_path: The new file which, if different, would overwrite the original content.
             style: The styling to use for the diff output. Defaults to colored.
             logger: Optional logger for operation information.
+            stats_only: If True, only count added and removed lines without building diff lines.
+            intraline: Highlight changed words ("word") or characters ("char") within paired
+                       changed lines. Only applies to the colored style. Defaults to None.
+            cache: An optional DiffCache to reuse results of identical comparisons. Defaults to
+                   PolyDiff.cache, which is None unless set.
 
         Returns:
             DiffResult containing the changes found.
@@ -39,6 +73,9 @@ class PolyDiff:
             filename=str(new_path),
             style=style,
             logger=logger,
+            stats_only=stats_only,
+            intraline=intraline,
+            cache=cache,
         )
 
     @classmethod
@@ -50,15 +87,28 @@ class PolyDiff:
         *,
         style: DiffStyle = DiffStyle.COLORED,
         logger: Logger | None = None,
+        stats_only: bool = False,
+        intraline: IntralineMode | str | None = None,
+        cache: DiffCache | None = None,
     ) -> DiffResult:
         """Show a unified diff between old and new content.
 
+        The returned DiffResult keeps only the hunk offsets into the split lines, and builds its
+        `changes`, `additions` and `deletions` lists the first time one of them is accessed. With
+        `stats_only`, no diff lines are generated at all and only the line counts are kept, which
+        is all you need to answer "did it change, and by how much?"
+
         Args:
             old: The original content to be compared against the new content.
             new: The new content which, if different, would overwrite the original content.
             filename: An optional filename to include in log messages for context.
             style: The styling to use for the diff output. Defaults to colored.
             logger: Optional logger for operation information.
+            stats_only: If True, only count added and removed lines without building diff lines.
+            intraline: Highlight changed words ("word") or characters ("char") within paired
+                       changed lines. Only applies to the colored style. Defaults to None.
+            cache: An optional DiffCache to reuse results of identical comparisons. Defaults to
+                   PolyDiff.cache, which is None unless set.
 
         Returns:
             A DiffResult object containing the changes that were identified.
@@ -71,40 +121,373 @@ class PolyDiff:
         log_func = logger or temp_logger
         content = filename or "text"
 
-        changes: list[str] = []
-        additions: list[str] = []
-        deletions: list[str] = []
+        old_lines = split_lines(old)
+        new_lines = split_lines(new)
+        fromfile = f"current {content}" if filename else "current"
+        tofile = f"new {content}" if filename else "new"
 
-        diff = list(
-            unified_diff(
-                old.splitlines(keepends=True),
-                new.splitlines(keepends=True),
-                fromfile=f"current {content}" if filename else "current",
-                tofile=f"new {content}" if filename else "new",
+        # Identical comparisons are served from the cache without running the matcher at all
+        cache = cache if cache is not None else cls.cache
+        result: DiffResult | None = None
+        key: str | None = None
+        if cache is not None:
+            key = cache.make_key(
+                old, new, style=style, stats_only=stats_only, headers=[fromfile, tofile]
             )
-        )
+            result = cache.get(key, old_lines, new_lines, fromfile, tofile)
+
+        if result is None:
+            result = cls._compute(old_lines, new_lines, fromfile, tofile, stats_only)
+            if cache is not None and key is not None:
+                cache.put(key, result)
+
+        if log_func:
+            cls._log_result(result, filename, style, log_func, intraline)
+
+        return result
+
+    @classmethod
+    def _log_result(
+        cls,
+        result: DiffResult,
+        filename: str | None,
+        style: DiffStyle,
+        log_func: Logger,
+        intraline: IntralineMode | str | None,
+    ) -> None:
+        """Log a summary of the result, followed by the diff lines unless it's stats-only."""
+        if not result.has_changes:
+            if filename:
+                log_func.info("No changes detected in %s.", filename)
+            return
+
+        if result.stats_only:
+            if filename:
+                added, removed = result.lines_added, result.lines_removed
+                log_func.info(
+                    "Changes detected in %s: %s line%s added, %s line%s removed.",
+                    filename,
+                    added,
+                    "s" if added != 1 else "",
+                    removed,
+                    "s" if removed != 1 else "",
+                )
+            return
+
+        if filename:
+            log_func.info("Changes detected in %s:", filename)
+
+        highlighter = None
+        if intraline and style == DiffStyle.COLORED:
+            highlighter = IntralineHighlighter(intraline, max_length=cls.INTRALINE_MAX_LENGTH)
+
+        # Line lists are never built here, since the lines are generated straight from the hunks
+        for line in result.iter_lines(highlighter):
+            cls._process_diff_line(line, style, log_func)
+
+    @classmethod
+    def _compute(
+        cls,
+        old_lines: list[str],
+        new_lines: list[str],
+        fromfile: str,
+        tofile: str,
+        stats_only: bool,
+    ) -> DiffResult:
+        """Run the line matcher and build a compact or stats-only DiffResult."""
+        matcher = line_matcher(old_lines, new_lines)
+
+        if stats_only:  # Count from the opcodes without building any diff lines
+            added, removed = count_opcodes(matcher.get_opcodes())
+            return DiffResult(bool(added or removed), lines_added=added, lines_removed=removed)
 
-        if not diff:
-            if log_func and filename:
-                log_func.info("No changes detected in %s.", content)
+        hunks = list(matcher.get_grouped_opcodes())
+        if not hunks:
             return DiffResult(False, [], [], [])
 
-        if log_func and filename:
-            log_func.info("Changes detected in %s:", content)
+        return DiffResult.from_hunks(old_lines, new_lines, hunks, fromfile, tofile)
 
-        for line in diff:
-            changes.append(line.rstrip())
-            if log_func:
-                cls._process_diff_line(line, style, log_func, additions, deletions)
+    @classmethod
+    def structured(
+        cls,
+        old: str | Any,
+        new: str | Any,
+        format: StructuredFormat | str = StructuredFormat.JSON,  # noqa: A002
+        filename: str | None = None,
+        *,
+        style: DiffStyle = DiffStyle.COLORED,
+        logger: Logger | None = None,
+    ) -> StructuredDiffResult:
+        """Show the key-path-level differences between two JSON, TOML or YAML documents.
+
+        Both sides are parsed and every subtree is hashed bottom-up, so identical subtrees are
+        skipped with a single digest comparison however large they are, and reformatting or
+        reordering keys doesn't produce any noise. List items are aligned on their digests, so an
+        inserted item doesn't show up as a change to everything after it.
+
+        Args:
+            old: The original document, as text or as already-parsed data.
+            new: The new document, as text or as already-parsed data.
+            format: The format of the documents: "json", "toml" or "yaml". YAML requires PyYAML.
+            filename: An optional filename to include in log messages for context.
+            style: The styling to use for the diff output. Defaults to colored.
+            logger: Optional logger for operation information.
+
+        Returns:
+            A StructuredDiffResult, which can be used like a DiffResult and also lists each
+            change with its key path in `entries`.
+
+        Raises:
+            ImportError: If YAML is requested but PyYAML is not installed.
+            ValueError: If either document can't be parsed.
+        """
+        old_data = parse(old, format) if isinstance(old, str) else old
+        new_data = parse(new, format) if isinstance(new, str) else new
+        result = StructuredDiffResult(compare_trees(hash_tree(old_data), hash_tree(new_data)))
+
+        log_func = logger
+        if logger is None and style != DiffStyle.MINIMAL:
+            log_func = PolyLog.get_logger(simple=True)
+        if log_func:
+            cls._log_result(result, filename, style, log_func, intraline=None)
+
+        return result
+
+    @classmethod
+    def merge3(
+        cls,
+        base: str,
+        ours: str,
+        theirs: str,
+        *,
+        ours_label: str = "ours",
+        theirs_label: str = "theirs",
+        base_label: str | None = None,
+        logger: Logger | None = None,
+    ) -> MergeResult:
+        """Merge two revisions of a text against their common base.
+
+        Changes made on only one side are applied, identical changes on both sides are applied
+        once, and overlapping changes become conflicts marked with Git-style conflict markers. The
+        merge is computed in-process using the same line-hash matching as the diff methods.
+
+        Args:
+            base: The common ancestor content.
+            ours: Our revision of the content, e.g. the user's local edits.
+            theirs: Their revision of the content, e.g. an updated upstream template.
+            ours_label: The label to show after the opening conflict marker.
+            theirs_label: The label to show after the closing conflict marker.
+            base_label: If given, include the base lines in each conflict (diff3 style).
+            logger: Optional logger for operation information.
+
+        Returns:
+            A MergeResult with the merged text and any conflict regions.
+        """
+        merger = Merge3(
+            split_lines(base),
+            split_lines(ours),
+            split_lines(theirs),
+        )
+        result = merger.merge(ours_label, theirs_label, base_label)
+
+        if logger:
+            if result.has_conflicts:
+                count = len(result.conflicts)
+                logger.warning(
+                    "Merge completed with %s conflict%s.", count, "s" if count != 1 else ""
+                )
+            else:
+                logger.info("Merge completed cleanly.")
+
+        return result
+
+    @classmethod
+    def apply(
+        cls,
+        original: str,
+        diff: str | Iterable[str],
+        *,
+        fuzz: int = 2,
+        max_offset: int | None = None,
+        logger: Logger | None = None,
+    ) -> PatchResult:
+        """Apply a unified diff to a piece of text, in-process and without calling `patch`.
+
+        Hunks that no longer sit at their stated line are searched for nearby, and if the context
+        around a hunk has drifted, up to `fuzz` lines of it may be ignored at each end. Hunks that
+        can't be placed are skipped and reported in the result. Passing the lines from
+        `DiffResult.iter_lines()` round-trips exactly, including a missing newline at the end.
+
+        Args:
+            original: The text to patch.
+            diff: The unified diff text or its lines, covering a single file.
+            fuzz: The maximum number of context lines that may be ignored at each end of a hunk.
+            max_offset: The maximum distance from a hunk's stated line to search, or None for no
+                        limit.
+            logger: Optional logger for operation information.
+
+        Returns:
+            A PatchResult with the patched text and the outcome of each hunk.
+
+        Raises:
+            ValueError: If the diff is malformed or covers more than one file.
+        """
+        patches = parse_patch(diff)
+        if len(patches) > 1:
+            msg = "Diff covers more than one file. Use PolyDiff.apply_tree() instead."
+            raise ValueError(msg)
+
+        hunks = patches[0].hunks if patches else []
+        applier = PatchApplier(fuzz=fuzz, max_offset=max_offset)
+        text, outcomes = applier.apply(split_lines(original), hunks)
+        result = PatchResult(text, outcomes)
+
+        if logger:
+            cls._log_patch_result(result, "text", logger)
+        return result
+
+    @classmethod
+    def apply_tree(
+        cls,
+        diff: str | Iterable[str],
+        root: str | Path,
+        *,
+        strip: int = 1,
+        fuzz: int = 2,
+        max_offset: int | None = None,
+        dry_run: bool = False,
+        logger: Logger | None = None,
+    ) -> list[PatchResult]:
+        """Apply a multi-file unified diff to a directory tree.
+
+        Every file is read and patched before any is written, and each file is only written if all
+        of its hunks apply. Writes are atomic: the new content goes to a temporary file next to the
+        target, which is then moved into place.
+        Files the patch creates or deletes (via /dev/null headers) are created or removed, but as
+        with `patch`, creating a file that already exists fails instead of overwriting it.
+
+        Args:
+            diff: The unified diff text or its lines.
+            root: The directory the paths in the diff are relative to.
+            strip: The number of leading path components to remove, like `patch -p`. Defaults to 1,
+                   which handles the a/ and b/ prefixes used by Git.
+            fuzz: The maximum number of context lines that may be ignored at each end of a hunk.
+            max_offset: The maximum distance from a hunk's stated line to search, or None for no
+                        limit.
+            dry_run: If True, report what would happen without writing anything.
+            logger: Optional logger for operation information.
+
+        Returns:
+            A list of PatchResult objects, one per file in the diff.
+
+        Raises:
+            ValueError: If the diff is malformed, a file path can't be determined or is outside the
+                root directory, or a file isn't valid UTF-8. Nothing is written in that case.
+        """
+        root = Path(root).resolve()
+        applier = PatchApplier(fuzz=fuzz, max_offset=max_offset)
+
+        # Check every path before writing anything, so a bad one doesn't leave a half-applied tree
+        targets = [
+            (file_patch, cls._resolve_target(file_patch, root, strip))
+            for file_patch in parse_patch(diff)
+        ]
+
+        # Patch everything in memory first, so a file that can't be read doesn't stop halfway
+        results = [
+            cls._patch_file(applier, file_patch, target, path, logger)
+            for file_patch, (target, path) in targets
+        ]
+
+        for (file_patch, (target, path)), result in zip(targets, results, strict=True):
+            if result.success and not dry_run:
+                if file_patch.is_deleted_file:
+                    path.unlink(missing_ok=True)
+                else:
+                    write_atomic(path, result.text)
+
+            if logger:
+                cls._log_patch_result(result, target, logger)
+
+        if logger:
+            failed = sum(1 for result in results if not result.success)
+            if failed:
+                logger.warning(
+                    "Failed to patch %s of %s file%s.",
+                    failed,
+                    len(results),
+                    "s" if len(results) != 1 else "",
+                )
             else:
-                # Still track additions and deletions even without logging
-                normalized_line = cls._normalize_diff_line(line)
-                if line.startswith("+"):
-                    additions.append(normalized_line)
-                elif line.startswith("-"):
-                    deletions.append(normalized_line)
+                logger.info(
+                    "%s %s file%s.",
+                    "Would patch" if dry_run else "Patched",
+                    len(results),
+                    "s" if len(results) != 1 else "",
+                )
+
+        return results
 
-        return DiffResult(True, changes, additions, deletions)
+    @staticmethod
+    def _patch_file(
+        applier: PatchApplier,
+        file_patch: FilePatch,
+        target: str,
+        path: Path,
+        logger: Logger | None,
+    ) -> PatchResult:
+        """Apply a file patch to the current content of a file, without writing anything.
+
+        Raises:
+            UnicodeDecodeError: If the file isn't valid UTF-8.
+        """
+        if file_patch.is_new_file and path.exists():  # Refuse to overwrite, like patch(1)
+            if logger:
+                logger.error("%s already exists, so the patch can't create it.", target)
+            outcomes = [
+                HunkOutcome(index, applied=False) for index in range(len(file_patch.hunks) or 1)
+            ]
+            return PatchResult("", outcomes, path)
+
+        original = ""
+        if path.is_file() and not file_patch.is_new_file:
+            with path.open(encoding="utf-8", newline="") as f:
+                original = f.read()
+        text, outcomes = applier.apply(split_lines(original), file_patch.hunks)
+        return PatchResult(text, outcomes, path)
+
+    @staticmethod
+    def _resolve_target(file_patch: FilePatch, root: Path, strip: int) -> tuple[str, Path]:
+        """Get the path a file patch applies to, making sure it's inside the root directory.
+
+        Raises:
+            ValueError: If the path can't be determined or points outside the root directory.
+        """
+        target = file_patch.target(strip)
+        if target is None:
+            msg = f"Cannot determine the file to patch from {file_patch.new_path!r}."
+            raise ValueError(msg)
+
+        path = (root / target).resolve()
+        if not path.is_relative_to(root):
+            msg = f"Refusing to patch {target!r}, which is outside {root}."
+            raise ValueError(msg)
+        return target, path
+
+    @classmethod
+    def _log_patch_result(cls, result: PatchResult, name: str, logger: Logger) -> None:
+        """Log how each hunk of a patch was applied."""
+        for hunk in result.hunks:
+            if not hunk.applied:
+                logger.error("Hunk #%s FAILED for %s.", hunk.index + 1, name)
+            elif hunk.offset or hunk.fuzz:
+                logger.info(
+                    "Hunk #%s succeeded for %s with offset %s and fuzz %s.",
+                    hunk.index + 1,
+                    name,
+                    hunk.offset,
+                    hunk.fuzz,
+                )
 
     @classmethod
     def _process_diff_line(
@@ -112,8 +495,6 @@ class PolyDiff:
         line: str,
         style: DiffStyle,
         log_func: Logger,
-        additions: list[str],
-        deletions: list[str],
     ) -> None:
         """Process a single line of diff output."""
         if not cls._should_show_line(line, style):
@@ -131,33 +512,10 @@ class PolyDiff:
         else:
             log_func.info("  %s", normalized_line if line.startswith(("+", "-")) else line.rstrip())
 
-        if line.startswith("+"):
-            additions.append(normalized_line)
-        elif line.startswith("-"):
-            deletions.append(normalized_line)
-
     @classmethod
     def _normalize_diff_line(cls, line: str) -> str:
         """Normalize a diff line by adding one additional space after the diff marker."""
-        # Normalize spacing only between the prefix and content
-        if line.startswith(("+", "-")):
-            prefix = line[0]
-            if len(line) > 1:
-                if line[1] == " " and (len(line) == 2 or line[2] != " "):
-                    # Already has exactly one space, keep as is
-                    normalized_line = line.rstrip()
-                elif line[1] == " ":
-                    # Has multiple spaces after prefix, normalize to one space
-                    normalized_line = prefix + " " + line[2:].rstrip()
-                else:
-                    # No space after prefix, add one
-                    normalized_line = prefix + " " + line[1:].rstrip()
-            else:
-                normalized_line = prefix + " "  # Just the prefix, add a space
-        else:
-            normalized_line = line.rstrip()
-
-        return normalized_line
+        return normalize_diff_line(line)
 
     @classmethod
     def _should_show_line(cls, line: str, style: DiffStyle) -> bool:
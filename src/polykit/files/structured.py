@@ -0,0 +1,168 @@
+"""Structural diffs of parsed JSON, TOML and YAML documents using bottom-up subtree hashing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any
+
+from polykit.files.types import StructuredChange, StructuredFormat
+
+# The keys and list indices leading to a value
+KeyPath = tuple[Any, ...]
+
+
+@dataclass
+class HashedNode:
+    """A parsed value annotated with a digest of its whole subtree.
+
+    Args:
+        digest: The digest of the value and everything below it.
+        value: The original value.
+        children: The hashed children of a mapping or list, or None for a scalar.
+    """
+
+    digest: bytes
+    value: Any
+    children: dict[Any, HashedNode] | list[HashedNode] | None = None
+
+
+def parse(text: str, fmt: StructuredFormat | str) -> Any:
+    """Parse a document in the given format.
+
+    YAML support requires PyYAML, which is imported only when needed.
+
+    Raises:
+        ImportError: If YAML is requested but PyYAML is not installed.
+        ValueError: If the format is not supported or the document can't be parsed.
+    """
+    fmt = StructuredFormat(fmt)
+
+    if fmt == StructuredFormat.YAML:
+        try:
+            import yaml
+        except ImportError as e:
+            msg = "YAML structural diffs require PyYAML. Install it with 'pip install pyyaml'."
+            raise ImportError(msg) from e
+        loader = yaml.safe_load
+    elif fmt == StructuredFormat.TOML:
+        import tomllib
+
+        loader = tomllib.loads
+    else:
+        loader = json.loads
+
+    try:
+        return loader(text)
+    except Exception as e:
+        msg = f"Failed to parse {fmt.value.upper()} document: {e}"
+        raise ValueError(msg) from e
+
+
+def hash_tree(value: Any) -> HashedNode:
+    """Hash a parsed value bottom-up, so equal subtrees have equal digests.
+
+    Mappings are hashed independently of key order, since reordering keys doesn't change meaning in
+    any of the supported formats. Lists are hashed in order. Scalars include their type, so `1`,
+    `1.0`, `"1"` and `true` all hash differently.
+    """
+    if isinstance(value, dict):
+        children = {key: hash_tree(child) for key, child in value.items()}
+        digest = hashlib.blake2b(b"d", digest_size=16)
+        for key in sorted(children, key=repr):
+            digest.update(_scalar_digest(key))
+            digest.update(children[key].digest)
+        return HashedNode(digest.digest(), value, children)
+
+    if isinstance(value, list | tuple):
+        items = [hash_tree(child) for child in value]
+        digest = hashlib.blake2b(b"l", digest_size=16)
+        for item in items:
+            digest.update(item.digest)
+        return HashedNode(digest.digest(), value, items)
+
+    return HashedNode(_scalar_digest(value), value)
+
+
+def _scalar_digest(value: Any) -> bytes:
+    """Hash a scalar value together with its type."""
+    data = f"{type(value).__name__}:{value!r}".encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def compare_trees(old: HashedNode, new: HashedNode, path: KeyPath = ()) -> list[StructuredChange]:
+    """Compare two hashed trees and report the key-path-level changes.
+
+    Subtrees with equal digests are skipped without being visited. Mapping keys are compared by
+    name, and list items are aligned on their digests so that insertions and removals don't show up
+    as a change to every following item.
+
+    Returns:
+        A list of changes in document order.
+    """
+    changes: list[StructuredChange] = []
+    _compare(old, new, path, changes)
+    return changes
+
+
+def _compare(
+    old: HashedNode, new: HashedNode, path: KeyPath, changes: list[StructuredChange]
+) -> None:
+    """Compare two nodes, recursing into containers whose digests differ."""
+    if old.digest == new.digest:
+        return
+
+    if isinstance(old.children, dict) and isinstance(new.children, dict):
+        _compare_mappings(old.children, new.children, path, changes)
+    elif isinstance(old.children, list) and isinstance(new.children, list):
+        _compare_lists(old.children, new.children, path, changes)
+    else:
+        changes.append(StructuredChange("changed", path, old.value, new.value))
+
+
+def _compare_mappings(
+    old: dict[Any, HashedNode],
+    new: dict[Any, HashedNode],
+    path: KeyPath,
+    changes: list[StructuredChange],
+) -> None:
+    """Compare two mappings key by key."""
+    for key, node in old.items():
+        if key in new:
+            _compare(node, new[key], (*path, key), changes)
+        else:
+            changes.append(StructuredChange("removed", (*path, key), old=node.value))
+
+    for key, node in new.items():
+        if key not in old:
+            changes.append(StructuredChange("added", (*path, key), new=node.value))
+
+
+def _compare_lists(
+    old: list[HashedNode],
+    new: list[HashedNode],
+    path: KeyPath,
+    changes: list[StructuredChange],
+) -> None:
+    """Compare two lists, aligning their items on subtree digests."""
+    matcher = SequenceMatcher(
+        None, [node.digest for node in old], [node.digest for node in new], autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+
+        # Pair up replaced items so nested changes are reported at their own paths
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(paired):
+            _compare(old[i1 + offset], new[j1 + offset], (*path, j1 + offset), changes)
+        changes.extend(
+            StructuredChange("removed", (*path, index), old=old[index].value)
+            for index in range(i1 + paired, i2)
+        )
+        changes.extend(
+            StructuredChange("added", (*path, index), new=new[index].value)
+            for index in range(j1 + paired, j2)
+        )
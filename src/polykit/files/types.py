@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import io
+import json
+from dataclasses import dataclass, field
 from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
+
+# A difflib opcode: (tag, old_start, old_end, new_start, new_end)
+Opcode = tuple[str, int, int, int, int]
+
+# A hunk is a group of opcodes that is rendered under a single @@ header
+Hunk = list[Opcode]
 
 
 class DiffStyle(StrEnum):
@@ -12,11 +25,408 @@ class DiffStyle(StrEnum):
     MINIMAL = "minimal"
 
 
-@dataclass
+class StructuredFormat(StrEnum):
+    """Formats supported by structural diffs."""
+
+    JSON = "json"
+    TOML = "toml"
+    YAML = "yaml"
+
+
+class IntralineMode(StrEnum):
+    """Granularity of intra-line change highlighting."""
+
+    WORD = "word"
+    CHAR = "char"
+
+
 class DiffResult:
-    """Result of a diff comparison."""
+    """Result of a diff comparison.
+
+    Results built by PolyDiff are compact: they keep the hunk offsets into the original line
+    sequences and only build the `changes`, `additions` and `deletions` lists the first time one of
+    them is accessed. Stats-only results keep nothing but the line counts, so accessing the line
+    lists on them raises a ValueError.
+
+    Args:
+        has_changes: Whether any differences were found.
+        changes: The full list of diff lines, if already built.
+        additions: The list of added lines, if already built.
+        deletions: The list of removed lines, if already built.
+        lines_added: The number of added lines. Computed from `additions` if not given.
+        lines_removed: The number of removed lines. Computed from `deletions` if not given.
+    """
+
+    def __init__(
+        self,
+        has_changes: bool,
+        changes: list[str] | None = None,
+        additions: list[str] | None = None,
+        deletions: list[str] | None = None,
+        *,
+        lines_added: int | None = None,
+        lines_removed: int | None = None,
+    ):
+        self.has_changes = has_changes
+        self._changes = changes
+        self._additions = additions
+        self._deletions = deletions
+        if lines_added is None:
+            lines_added = len(additions) if additions is not None else 0
+        if lines_removed is None:
+            lines_removed = len(deletions) if deletions is not None else 0
+        self._lines_added = lines_added
+        self._lines_removed = lines_removed
+
+        # Set by from_hunks() for lazily materialized results
+        self._old_lines: Sequence[str] = ()
+        self._new_lines: Sequence[str] = ()
+        self._hunks: list[Hunk] = []
+        self._headers: tuple[str, str] = ("", "")
+
+    @classmethod
+    def from_hunks(
+        cls,
+        old_lines: Sequence[str],
+        new_lines: Sequence[str],
+        hunks: list[Hunk],
+        fromfile: str = "current",
+        tofile: str = "new",
+    ) -> DiffResult:
+        """Build a compact result that materializes its line lists on first access.
+
+        Args:
+            old_lines: The original lines, including line endings.
+            new_lines: The new lines, including line endings.
+            hunks: The grouped opcodes describing each hunk.
+            fromfile: The label for the original side in the diff header.
+            tofile: The label for the new side in the diff header.
+        """
+        added, removed = count_opcodes(op for hunk in hunks for op in hunk)
+        result = cls(bool(hunks), lines_added=added, lines_removed=removed)
+        result._old_lines = old_lines
+        result._new_lines = new_lines
+        result._hunks = hunks
+        result._headers = (fromfile, tofile)
+        return result
+
+    @property
+    def stats_only(self) -> bool:
+        """Whether this result only carries line counts."""
+        return self._changes is None and not self._hunks and self.has_changes
+
+    @property
+    def lines_added(self) -> int:
+        """The number of added lines."""
+        return self._lines_added
+
+    @property
+    def lines_removed(self) -> int:
+        """The number of removed lines."""
+        return self._lines_removed
+
+    @property
+    def hunks(self) -> list[Hunk]:
+        """The grouped opcodes for each hunk, or an empty list if none are stored."""
+        return self._hunks
+
+    @property
+    def changes(self) -> list[str]:
+        """All lines of the unified diff, with trailing whitespace removed."""
+        if self._changes is None:
+            self._materialize()
+        return self._changes or []
+
+    @property
+    def additions(self) -> list[str]:
+        """The added lines, normalized to a single space after the marker."""
+        if self._additions is None:
+            self._materialize()
+        return self._additions or []
+
+    @property
+    def deletions(self) -> list[str]:
+        """The removed lines, normalized to a single space after the marker."""
+        if self._deletions is None:
+            self._materialize()
+        return self._deletions or []
+
+    def iter_lines(
+        self,
+        highlighter: Callable[[list[str], list[str]], tuple[list[str], list[str]]] | None = None,
+    ) -> Iterator[str]:
+        """Yield the raw unified diff lines, generated from the stored hunks.
+
+        Args:
+            highlighter: An optional callable that receives the old and new lines of each replaced
+                         block and returns decorated versions of both, used for display only.
+
+        Raises:
+            ValueError: If this is a stats-only result.
+        """
+        if self.stats_only:
+            msg = "Diff lines are not available for a stats-only DiffResult."
+            raise ValueError(msg)
+
+        if not self._hunks:  # Eagerly built result, so just hand back what we have
+            yield from self._changes or []
+            return
+
+        old, new = self._old_lines, self._new_lines
+        yield f"--- {self._headers[0]}\n"
+        yield f"+++ {self._headers[1]}\n"
+
+        for hunk in self._hunks:
+            first, last = hunk[0], hunk[-1]
+            old_range = _format_range(first[1], last[2])
+            new_range = _format_range(first[3], last[4])
+            yield f"@@ -{old_range} +{new_range} @@\n"
+
+            for tag, i1, i2, j1, j2 in hunk:
+                if tag == "equal":
+                    for line in old[i1:i2]:
+                        yield f" {line}"
+                    continue
+
+                old_block, new_block = old[i1:i2], new[j1:j2]
+                if tag == "replace" and highlighter is not None:
+                    old_block, new_block = highlighter(list(old_block), list(new_block))
+                for line in old_block:
+                    yield f"-{line}"
+                for line in new_block:
+                    yield f"+{line}"
+
+    def _materialize(self) -> None:
+        """Build the line lists from the stored hunks."""
+        changes: list[str] = []
+        additions: list[str] = []
+        deletions: list[str] = []
+
+        for index, line in enumerate(self.iter_lines()):
+            changes.append(line.rstrip())
+            if index < 2 and self._hunks:  # Skip the ---/+++ file headers
+                continue
+            if line.startswith("+"):
+                additions.append(normalize_diff_line(line))
+            elif line.startswith("-"):
+                deletions.append(normalize_diff_line(line))
+
+        self._changes, self._additions, self._deletions = changes, additions, deletions
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DiffResult):
+            return NotImplemented
+        if self.has_changes != other.has_changes:
+            return False
+        if self.stats_only or other.stats_only:
+            return (self.lines_added, self.lines_removed) == (
+                other.lines_added,
+                other.lines_removed,
+            )
+        return (self.changes, self.additions, self.deletions) == (
+            other.changes,
+            other.additions,
+            other.deletions,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(has_changes={self.has_changes}, "
+            f"lines_added={self.lines_added}, lines_removed={self.lines_removed})"
+        )
+
+
+@dataclass
+class StructuredChange:
+    """A single key-path-level change found by a structural diff.
+
+    Args:
+        kind: Whether the value was "added", "removed" or "changed".
+        path: The keys and list indices leading to the value. Keys are usually strings, but YAML
+            and TOML also allow numbers, booleans, dates and null.
+        old: The previous value, or None if it was added.
+        new: The new value, or None if it was removed.
+    """
+
+    kind: str
+    path: tuple[Any, ...]
+    old: Any = None
+    new: Any = None
+
+    @property
+    def path_str(self) -> str:
+        """The path in dotted form, e.g. `servers[0].host`, with other keys like `ports[8080]`."""
+        parts: list[str] = []
+        for part in self.path:
+            if isinstance(part, str):
+                if part.isidentifier() or part.replace("-", "_").isidentifier():
+                    parts.append(f".{part}" if parts else part)
+                else:
+                    parts.append(f"[{part!r}]")
+            elif type(part) is int:  # Not bool, which would otherwise show as [True]
+                parts.append(f"[{part}]")
+            else:
+                parts.append(f"[{_render_value(part)}]")
+        return "".join(parts) or "(root)"
+
+
+class StructuredDiffResult(DiffResult):
+    """Result of a structural diff, usable anywhere a DiffResult is.
+
+    Each change is rendered as `-path: old` and `+path: new` lines, so the colored output and the
+    `changes`, `additions` and `deletions` lists work the same as for a line diff. The individual
+    key-path changes are available in `entries`.
+
+    Args:
+        entries: The key-path-level changes that were found.
+    """
+
+    def __init__(self, entries: list[StructuredChange]):
+        changes: list[str] = []
+        additions: list[str] = []
+        deletions: list[str] = []
+
+        for entry in entries:
+            if entry.kind in {"removed", "changed"}:
+                line = f"-{entry.path_str}: {_render_value(entry.old)}"
+                changes.append(line)
+                deletions.append(normalize_diff_line(line))
+            if entry.kind in {"added", "changed"}:
+                line = f"+{entry.path_str}: {_render_value(entry.new)}"
+                changes.append(line)
+                additions.append(normalize_diff_line(line))
+
+        super().__init__(bool(entries), changes, additions, deletions)
+        self.entries = entries
+
+
+@dataclass
+class MergeConflict:
+    """A region where both sides of a three-way merge changed the same base lines differently.
+
+    All ranges are half-open line indices (start, end) into their respective sequences.
+    """
+
+    base_range: tuple[int, int]
+    ours_range: tuple[int, int]
+    theirs_range: tuple[int, int]
+    merged_range: tuple[int, int]
+    base: list[str]
+    ours: list[str]
+    theirs: list[str]
+
+
+@dataclass
+class MergeResult:
+    """Result of a three-way merge."""
+
+    text: str
+    conflicts: list[MergeConflict] = field(default_factory=list)
+
+    @property
+    def has_conflicts(self) -> bool:
+        """Whether the merge produced any conflicts."""
+        return bool(self.conflicts)
+
+
+@dataclass
+class HunkOutcome:
+    """How a single hunk of a patch was applied.
+
+    Args:
+        index: The position of the hunk within its file patch.
+        applied: Whether the hunk was applied.
+        offset: How many lines away from its stated position the hunk was applied.
+        fuzz: How many lines of leading and trailing context had to be ignored to apply it.
+    """
+
+    index: int
+    applied: bool
+    offset: int = 0
+    fuzz: int = 0
+
+
+@dataclass
+class PatchResult:
+    """Result of applying a patch to a single file or text."""
+
+    text: str
+    hunks: list[HunkOutcome] = field(default_factory=list)
+    path: Path | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether every hunk was applied."""
+        return all(hunk.applied for hunk in self.hunks)
+
+    @property
+    def failed(self) -> list[HunkOutcome]:
+        """The hunks that could not be applied."""
+        return [hunk for hunk in self.hunks if not hunk.applied]
+
+
+def count_opcodes(opcodes: Iterator[Opcode] | Sequence[Opcode]) -> tuple[int, int]:
+    """Count added and removed lines from a sequence of difflib opcodes.
+
+    Returns:
+        A tuple of (lines_added, lines_removed).
+    """
+    added = removed = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag in {"replace", "delete"}:
+            removed += i2 - i1
+        if tag in {"replace", "insert"}:
+            added += j2 - j1
+    return added, removed
+
+
+def split_lines(text: str) -> list[str]:
+    """Split text into lines at newlines only, keeping the line endings.
+
+    Unlike `str.splitlines()`, this doesn't split at form feeds, Unicode line separators and other
+    characters that diff tools treat as part of a line, so patches round-trip through files that
+    contain them.
+    """
+    return io.StringIO(text, newline="\n").readlines()
+
+
+def normalize_diff_line(line: str) -> str:
+    """Normalize a diff line by adding one additional space after the diff marker."""
+    # Normalize spacing only between the prefix and content
+    if line.startswith(("+", "-")):
+        prefix = line[0]
+        if len(line) > 1:
+            if line[1] == " " and (len(line) == 2 or line[2] != " "):
+                # Already has exactly one space, keep as is
+                normalized_line = line.rstrip()
+            elif line[1] == " ":
+                # Has multiple spaces after prefix, normalize to one space
+                normalized_line = prefix + " " + line[2:].rstrip()
+            else:
+                # No space after prefix, add one
+                normalized_line = prefix + " " + line[1:].rstrip()
+        else:
+            normalized_line = prefix + " "  # Just the prefix, add a space
+    else:
+        normalized_line = line.rstrip()
+
+    return normalized_line
+
+
+def _render_value(value: Any) -> str:
+    """Render a value compactly for a structural diff line."""
+    try:
+        return json.dumps(value, ensure_ascii=False, separators=(", ", ": "), default=str)
+    except (TypeError, ValueError):
+        return repr(value)
+
 
-    has_changes: bool
-    changes: list[str]
-    additions: list[str]
-    deletions: list[str]
+def _format_range(start: int, stop: int) -> str:
+    """Format a line range the same way as difflib's unified diff headers."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
@@ -0,0 +1,194 @@
+"""Filters that cut down log floods: deduplication, sampling and per-call-site rate limiting.
+
+All three are cheap enough to sit in front of every record. Add them to a logger with the
+`filters` argument of `PolyLog.get_logger()`, which runs them once per record before any handler,
+or to a logger or handler of your own with `addFilter()`. A DuplicateFilter meant for a single
+handler should be given that handler instead, so its summaries go only there.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import random
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+from polykit.log.types import LogLevel
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_random = random.random
+
+# Every live DuplicateFilter, so repeats still held back at exit can be reported
+_duplicate_filters: weakref.WeakSet[DuplicateFilter] = weakref.WeakSet()
+
+
+class _RepeatSummary(logging.LogRecord):
+    """A record reporting how many duplicates were collapsed, which filters let through."""
+
+
+class DuplicateFilter(logging.Filter):
+    """Collapse consecutive identical messages into a single "repeated N times" record.
+
+    The first occurrence is logged as usual, and repeats of it (same logger, level, message and
+    arguments) are counted instead. When a different message comes along, or every `interval`
+    seconds while the repeats continue, a summary like "Disk full (repeated 250 times)" is logged
+    in their place. Repeats still held back at exit are summarized then, and `flush()` does the same
+    at any other time.
+
+    Summaries are sent to every handler of the logger the repeats came from, the same as any other
+    record, so add the filter to that logger. To deduplicate at a single handler instead, pass it as
+    `handler`: the filter adds itself to the handler and sends summaries only there.
+
+    Args:
+        interval: The longest time in seconds to hold back repeats before summarizing them.
+        handler: The handler to filter and send summaries to, or None to filter a logger.
+    """
+
+    def __init__(self, interval: float = 10.0, handler: logging.Handler | None = None):
+        super().__init__()
+        self.interval = interval
+        self.handler = handler
+        self._last: logging.LogRecord | None = None
+        self._repeats = 0
+        self._since = 0.0
+        self._lock = threading.Lock()
+        _duplicate_filters.add(self)
+        if handler is not None:
+            handler.addFilter(self)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Let a record through unless it repeats the previous one."""
+        if isinstance(record, _RepeatSummary):
+            return True
+
+        with self._lock:
+            last = self._last
+            if (
+                last is not None
+                and record.msg == last.msg
+                and record.levelno == last.levelno
+                and record.name == last.name
+                and _same_args(record.args, last.args)
+            ):
+                self._repeats += 1
+                self._last = record
+                if record.created - self._since < self.interval:
+                    return False
+                # Held back for long enough, so report the repeats, including this one
+                summary, keep = self._take_summary(), False
+                self._since = record.created
+            else:
+                summary, keep = self._take_summary(), True
+                self._last, self._since = record, record.created
+
+        if summary is not None:
+            self._emit(summary)
+        return keep
+
+    def flush(self) -> None:
+        """Log the summary of any repeats held back so far."""
+        with self._lock:
+            summary = self._take_summary()
+        if summary is not None:
+            self._emit(summary)
+
+    def _emit(self, summary: _RepeatSummary) -> None:
+        """Send a summary to the filtered handler, or to the handlers of the logger it's from."""
+        if self.handler is None:
+            logging.getLogger(summary.name).callHandlers(summary)
+        elif summary.levelno >= self.handler.level:
+            self.handler.handle(summary)
+
+    def _take_summary(self) -> _RepeatSummary | None:
+        """Build the summary for the repeats counted so far, and reset the count."""
+        if not self._repeats or self._last is None:
+            return None
+
+        # Built like logging.makeLogRecord(), but as the subclass so filters can recognize it
+        summary = _RepeatSummary("", logging.NOTSET, "", 0, "", None, None)
+        summary.__dict__.update(self._last.__dict__)
+        times = "time" if self._repeats == 1 else "times"
+        summary.msg = f"{self._last.getMessage()} (repeated {self._repeats} {times})"
+        summary.args = None
+        self._repeats = 0
+        return summary
+
+
+def _same_args(args: object, other: object) -> bool:
+    """Compare the arguments of two records, treating any error from `__eq__` as a difference."""
+    if args is other:
+        return True
+    try:
+        return bool(args == other)
+    except Exception:  # Such as comparing NumPy arrays, whose truth value is ambiguous
+        return False
+
+
+def _flush_duplicate_filters() -> None:
+    """Log the summaries of repeats that every DuplicateFilter is still holding back."""
+    for duplicate_filter in list(_duplicate_filters):
+        duplicate_filter.flush()
+
+
+atexit.register(_flush_duplicate_filters)
+
+
+class SamplingFilter(logging.Filter):
+    """Let through only a random fraction of records at each level.
+
+    Args:
+        rates: The fraction of records to keep for each level, from 0.0 to 1.0, such as
+            `{"DEBUG": 0.01, "INFO": 0.1}`. Levels that aren't listed are always kept.
+    """
+
+    def __init__(self, rates: Mapping[int | str | LogLevel, float]):
+        super().__init__()
+        self.rates = {LogLevel.get_level(level): rate for level, rate in rates.items()}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep a record with the probability set for its level."""
+        rate = self.rates.get(record.levelno)
+        return rate is None or _random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """Limit how often each line of code can log, with a token bucket per call site.
+
+    Each call site (file and line number) can log `burst` records at once, and then `rate` records
+    per second on average. Records over the limit are dropped and counted in `dropped`. The record
+    timestamps are used as the clock, so the filter makes no system calls. Buckets aren't locked,
+    so with heavy logging from many threads at the same call site the limit is approximate.
+
+    Args:
+        rate: The average number of records per second to allow from each call site.
+        burst: The number of records a call site can log at once before it's limited.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 20):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.dropped = 0
+        self._buckets: dict[tuple[str, int], list[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Let a record through if its call site has a token to spend."""
+        key = (record.pathname, record.lineno)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [self.burst - 1.0, record.created]
+            return True
+
+        tokens = min(self.burst, bucket[0] + (record.created - bucket[1]) * self.rate)
+        bucket[1] = record.created
+        if tokens < 1.0:
+            bucket[0] = tokens
+            self.dropped += 1
+            return False
+
+        bucket[0] = tokens - 1.0
+        return True
@@ -1,35 +1,86 @@
 from __future__ import annotations
 
+import json
 import os
-from dataclasses import dataclass
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from datetime import time as dt_time
+from enum import Enum
+from json.encoder import encode_basestring as _escape
 from logging import Formatter, LogRecord
+from pathlib import PurePath
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from polykit.log.types import LogColors, LogLevel
 
 
+# Bracketed level names shown in the detailed format
+LEVEL_TEXTS: dict[str, str] = {
+    "CRITICAL": "[CRITICAL]",
+    "ERROR": "[ERROR]",
+    "WARNING": "[WARN]",
+    "INFO": "[INFO]",
+    "DEBUG": "[DEBUG]",
+}
+
+
 @dataclass
 class CustomFormatter(Formatter):
-    """Custom log formatter supporting both basic and advanced formats."""
+    """Custom log formatter supporting both basic and advanced formats.
+
+    Everything that doesn't depend on the record itself is worked out ahead of time: the timezone
+    is resolved once, the timestamp is rendered once per second, and the colored text around the
+    timestamp and message is built once for each level and logger name. Formatting a record is
+    then just a few string concatenations.
+    """
 
     simple: bool = False
     show_context: bool = False
     color: bool = True
 
+    _tz: ZoneInfo = field(init=False, repr=False)
+    _time: tuple[int, str] = field(default=(-1, ""), init=False, repr=False)
+    _parts: dict[tuple[str, str, bool, bool, bool], tuple[str, str, str, str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def __post_init__(self):
         super().__init__()
+        self._tz = ZoneInfo(os.getenv("TZ", "America/New_York"))
 
     def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:  # noqa
         """Format the time in a log record."""
-        tz = ZoneInfo(os.getenv("TZ", "America/New_York"))
-        ct = datetime.fromtimestamp(record.created, tz=tz)
+        ct = datetime.fromtimestamp(record.created, tz=self._tz)
         return ct.strftime(datefmt) if datefmt else ct.isoformat()
 
     def format(self, record: LogRecord) -> str:
         """Format the log record based on the formatter style."""
+        # Add the timestamp to the record, rendering it only once per second. The second and its
+        # text are stored together so other threads never see one updated without the other.
+        second = int(record.created)
+        cached = self._time
+        if cached[0] != second:
+            cached = self._time = (second, self.formatTime(record, "%I:%M:%S %p"))
+        record.asctime = cached[1]
+
+        key = (record.levelname, record.name, self.simple, self.show_context, self.color)
+        parts = self._parts.get(key)
+        if parts is None:
+            parts = self._parts[key] = self._build_parts(record.levelname, record.name)
+        head, middle, opener, tail = parts
+
+        if self.simple:
+            return f"{head}{record.getMessage()}{tail}"
+        if self.show_context:
+            return f"{head}{record.asctime}{middle}{record.funcName}{opener}{record.getMessage()}{tail}"
+        return f"{head}{record.asctime}{middle}{opener}{record.getMessage()}{tail}"
+
+    def _build_parts(self, levelname: str, name: str) -> tuple[str, str, str, str]:
+        """Build the fixed text that goes around the timestamp, function name and message."""
         if self.color:
-            level_color = LogLevel.get_color(record.levelname)
+            level_color = LogLevel.get_color(levelname)
             reset = LogColors.RESET
             bold = LogColors.BOLD
             gray = LogColors.GRAY
@@ -38,38 +89,23 @@ class CustomFormatter(Formatter):
         else:
             level_color = reset = bold = gray = blue = cyan = ""
 
-        # Add the timestamp to the record
-        record.asctime = self.formatTime(record, "%I:%M:%S %p")
-
         if self.simple:  # Messages above INFO show in bold
-            bold = "" if record.levelname in {"DEBUG", "INFO"} else bold
-            return f"{reset}{bold}{level_color}{record.getMessage()}{reset}"
-
-        # Format the timestamp
-        timestamp = f"{reset}{gray}{record.asctime}{reset} "
+            bold = "" if levelname in {"DEBUG", "INFO"} else bold
+            return f"{reset}{bold}{level_color}", "", "", f"{reset}"
 
         # Format the log level text
-        level_texts = {
-            "CRITICAL": "[CRITICAL]",
-            "ERROR": "[ERROR]",
-            "WARNING": "[WARN]",
-            "INFO": "[INFO]",
-            "DEBUG": "[DEBUG]",
-        }
-        level_text = level_texts.get(record.levelname, "")
-        log_level = f"{bold}{level_color}{level_text}{reset}"
+        log_level = f"{bold}{level_color}{LEVEL_TEXTS.get(levelname, '')}{reset}"
 
         # Add level color to reset if above INFO
-        if record.levelname not in {"DEBUG", "INFO"}:
-            reset = f"{level_color}{reset}"
+        message_reset = reset if levelname in {"DEBUG", "INFO"} else f"{level_color}{reset}"
 
-        # Format the function color and name
-        class_name = f" {blue}{record.name}:{reset} " if self.show_context else ""
-        function = f"{cyan}{record.funcName}: " if self.show_context else " "
-
-        # Format the message and return the formatted message
-        message = f"{level_color}{record.getMessage()}{reset}"
-        return f"{timestamp}{log_level}{class_name}{function}{message}"
+        # The timestamp goes between the head and the middle, and the function name (if shown)
+        # between the middle and the opener
+        head = f"{reset}{gray}"
+        if self.show_context:
+            middle = f"{reset} {log_level} {blue}{name}:{message_reset} {cyan}"
+            return head, middle, f": {level_color}", message_reset
+        return head, f"{reset} {log_level} ", f"{level_color}", message_reset
 
 
 @dataclass
@@ -80,3 +116,81 @@ class FileFormatter(Formatter):
         """Format a log record for file output."""
         record.asctime = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
         return f"[{record.asctime}] [{record.levelname}] {record.name}: {record.funcName}: {record.getMessage()}"
+
+
+# Attributes every LogRecord has, so anything else on a record came from `extra`
+_PLAIN_RECORD = LogRecord("", 0, "", 0, "", None, None).__dict__
+RECORD_ATTRIBUTES = frozenset(_PLAIN_RECORD) | {"asctime", "message", "taskName"}
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a value the JSON encoder doesn't handle natively."""
+    if isinstance(value, datetime | date | dt_time):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, set | frozenset | tuple):
+        return list(value)
+    if isinstance(value, PurePath | bytes):
+        return str(value)
+    return repr(value)
+
+
+# One shared encoder, rather than the new one json.dumps() creates for every call with options
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_to_json).encode
+
+
+@dataclass
+class JSONFormatter(Formatter):
+    """Formatter class for JSON lines, with one compact JSON object per record.
+
+    Each object has the UTC `timestamp` (ISO 8601 with milliseconds), `level`, `logger`,
+    `function` and `message`, plus an `extra` object with any fields passed through `extra` and
+    `exception` and `stack` with the traceback and stack, if there are any. Values JSON doesn't
+    support are converted: dates and times to ISO 8601, enums to their value, sets and tuples to
+    lists, paths to strings, and anything else to its repr.
+
+    The fixed fields are written directly, with only the strings escaped and the level and logger
+    name escaped just once each, so the JSON encoder only runs for `extra` fields.
+    """
+
+    _time: tuple[int, str] = field(default=(-1, ""), init=False, repr=False)
+    _heads: dict[tuple[str, str], str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        super().__init__()
+
+    def format(self, record: LogRecord) -> str:
+        """Format a log record as a single line of JSON."""
+        second = int(record.created)
+        cached = self._time
+        if cached[0] != second:  # Render the date and time only once per second
+            cached = self._time = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        milliseconds = int((record.created - second) * 1000)
+
+        head = self._heads.get((record.levelname, record.name))
+        if head is None:
+            head = f'Z","level":{_escape(record.levelname)},"logger":{_escape(record.name)}'
+            self._heads[record.levelname, record.name] = head
+
+        line = (
+            f'{{"timestamp":"{cached[1]}.{milliseconds:03d}{head},'
+            f'"function":{_escape(record.funcName)},"message":{_escape(record.getMessage())}'
+        )
+
+        attributes = record.__dict__
+        if len(attributes) > len(_PLAIN_RECORD):  # Only look for extra fields if there can be any
+            extra = {
+                key: value for key, value in attributes.items() if key not in RECORD_ATTRIBUTES
+            }
+            if extra:
+                line += f',"extra":{_encode(extra)}'
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += f',"exception":{_escape(record.exc_text)}'
+        if record.stack_info:
+            line += f',"stack":{_escape(self.formatStack(record.stack_info))}'
+
+        return line + "}"
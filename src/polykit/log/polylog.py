@@ -9,10 +9,14 @@ from __future__ import annotations
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from polykit.core.singleton import Singleton
-from polykit.log.formatters import CustomFormatter, FileFormatter
-from polykit.log.types import LogLevel
+from polykit.log.formatters import CustomFormatter, FileFormatter, JSONFormatter
+from polykit.log.types import LogFormat, LogLevel, OverflowPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
 class PolyLog(metaclass=Singleton):
@@ -47,6 +51,10 @@ class PolyLog(metaclass=Singleton):
         color: bool = True,
         log_file: Path | None = None,
         time_aware: bool = False,
+        async_io: bool = False,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        format: LogFormat | str = LogFormat.TEXT,  # noqa: A002
+        filters: Sequence[logging.Filter] = (),
     ) -> logging.Logger:
         """Get a configured logger instance.
 
@@ -63,6 +71,17 @@ class PolyLog(metaclass=Singleton):
                       addition to the console. Defaults to None, which means no file logging.
             time_aware: If True, returns a TimeAwareLogger that automatically formats datetime
                         objects in log messages. Defaults to False.
+            async_io: If True, records are written by a background thread, so logging never waits
+                      on a slow console or file. Defaults to False.
+            overflow: What to do when async_io is on and the queue of records waiting to be written
+                      is full: "block" to wait for room, "drop-oldest" to discard the oldest queued
+                      record, or "drop-debug" to discard DEBUG records and wait for anything else.
+                      Defaults to "block".
+            format: The output format: "text" for human-readable lines, or "jsonl" for one JSON
+                    object per line, on the console and in the log file, for log shippers.
+                    Defaults to "text".
+            filters: Filters to run once on every record before it reaches any handler, such as
+                     those in `polykit.log.filters` for deduplication, sampling and rate limiting.
 
         Returns:
             A configured standard Logger or TimeAwareLogger instance.
@@ -74,7 +93,12 @@ class PolyLog(metaclass=Singleton):
             log_level = LogLevel.get_level(level)
             logger.setLevel(log_level)
 
-            log_formatter = CustomFormatter(simple=simple, color=color, show_context=show_context)
+            json_lines = LogFormat(format) is LogFormat.JSONL
+            log_formatter = (
+                JSONFormatter()
+                if json_lines
+                else CustomFormatter(simple=simple, color=color, show_context=show_context)
+            )
 
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(log_formatter)
@@ -82,14 +106,22 @@ class PolyLog(metaclass=Singleton):
             logger.addHandler(console_handler)
 
             if log_file:
-                PolyLog._add_file_handler(logger, log_file)
+                PolyLog._add_file_handler(
+                    logger, log_file, JSONFormatter() if json_lines else FileFormatter()
+                )
+
+            for log_filter in filters:
+                logger.addFilter(log_filter)
+
+            if async_io:
+                PolyLog._queue_handlers(logger, overflow)
 
             logger.propagate = False
 
         if time_aware:
             from polykit.log.time_aware import TimeAwareLogger
 
-            return TimeAwareLogger(logger)
+            return TimeAwareLogger.for_logger(logger)
 
         return logger
 
@@ -131,9 +163,21 @@ class PolyLog(metaclass=Singleton):
         return "unknown"
 
     @staticmethod
-    def _add_file_handler(logger: logging.Logger, log_file: Path) -> None:
+    def _queue_handlers(logger: logging.Logger, overflow: OverflowPolicy | str) -> None:
+        """Move the logger's handlers behind a queue written by a background thread."""
+        from polykit.log.queueing import QueueingHandler
+
+        handlers = list(logger.handlers)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(QueueingHandler(handlers, overflow))
+
+    @staticmethod
+    def _add_file_handler(
+        logger: logging.Logger, log_file: Path, formatter: logging.Formatter | None = None
+    ) -> None:
         """Add a file handler to the given logger."""
-        formatter = FileFormatter()
+        formatter = formatter or FileFormatter()
         log_dir = Path(log_file).parent
 
         if not log_dir.exists():
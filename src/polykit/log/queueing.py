@@ -0,0 +1,176 @@
+"""Non-blocking logging through a bounded queue with a single background listener per process."""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import logging
+import os
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import Empty, Full, Queue
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from polykit.log.types import OverflowPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The most records that can wait to be written before the overflow policy applies
+DEFAULT_QUEUE_SIZE = 10_000
+
+_queue: Queue[Any] | None = None
+_listener: QueueListener | None = None
+_stopped = False
+_lock = threading.Lock()
+_exception_formatter = logging.Formatter()
+
+
+class _DispatchListener(QueueListener):
+    """A queue listener that passes each record to the handlers it was queued for."""
+
+    # The stop signal, as set by the base class, which typeshed doesn't declare
+    _sentinel: ClassVar[None] = None
+
+    def __init__(self, queue: Queue[Any]):
+        super().__init__(queue)
+        self._records = queue  # The base class only types it as a protocol without put()
+
+    def handle(self, record: Any) -> None:
+        handlers, record = record
+        _handle(handlers, record)
+
+    def enqueue_sentinel(self) -> None:
+        """Wait for room for the stop signal, where the base class fails if the queue is full."""
+        self._records.put(self._sentinel)
+
+
+def _handle(handlers: Sequence[logging.Handler], record: logging.LogRecord) -> None:
+    """Pass a record to each handler whose level it meets."""
+    for handler in handlers:
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+
+def _get_queue() -> Queue[Any] | None:
+    """Get the shared queue, starting the listener on first use, or None once it's stopped."""
+    global _queue, _listener  # noqa: PLW0603
+
+    if _queue is not None or _stopped:
+        return _queue
+
+    with _lock:
+        if _queue is None and not _stopped:
+            queue: Queue[Any] = Queue(DEFAULT_QUEUE_SIZE)
+            _listener = _DispatchListener(queue)
+            _listener.start()
+            _queue = queue
+    return _queue
+
+
+def stop_queue_listener() -> None:
+    """Write out everything still queued and stop the background listener.
+
+    This runs automatically at exit. Records logged afterward are written on the calling thread.
+    """
+    global _queue, _listener, _stopped  # noqa: PLW0603
+
+    with _lock:
+        listener, _listener = _listener, None
+        _queue, _stopped = None, True
+    if listener is not None:
+        listener.stop()
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's queue in a forked child, whose copy has no listener thread."""
+    global _queue, _listener, _stopped, _lock  # noqa: PLW0603
+
+    _queue, _listener, _stopped, _lock = None, None, False, threading.Lock()
+
+
+atexit.register(stop_queue_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class QueueingHandler(QueueHandler):
+    """A handler that hands records to a background thread to be formatted and written.
+
+    Logging calls only merge the message with its arguments and put the record on a bounded queue
+    shared by every queueing handler in the process, so slow consoles, pipes and files don't stall
+    the calling thread. One listener thread writes the records with the wrapped handlers, and
+    everything still queued is written at exit.
+
+    Args:
+        handlers: The handlers that actually write the records.
+        overflow: What to do when the queue is full.
+    """
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+    ):
+        super().__init__(None)  # type: ignore[arg-type]
+        self.handlers = tuple(handlers)
+        self.overflow = OverflowPolicy(overflow)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments and render any traceback while they're still current."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the shared queue, applying the overflow policy if it's full."""
+        queue = _get_queue()
+        if queue is None:  # Shutting down, so write it here instead
+            _handle(self.handlers, record)
+            return
+
+        item = (self.handlers, record)
+        if self.overflow is OverflowPolicy.BLOCK:
+            queue.put(item)
+            return
+
+        try:
+            queue.put_nowait(item)
+        except Full:
+            self._overflow(queue, item)
+
+    def _overflow(self, queue: Queue[Any], item: tuple[Any, logging.LogRecord]) -> None:
+        """Make room for a record in a full queue, or drop it, depending on the policy."""
+        if self.overflow is OverflowPolicy.DROP_DEBUG:
+            if item[1].levelno <= logging.DEBUG:
+                self.dropped += 1
+            else:
+                queue.put(item)
+            return
+
+        while True:  # Drop the oldest records until there's room
+            try:
+                queue.get_nowait()
+                self.dropped += 1
+            except Empty:
+                pass
+            try:
+                queue.put_nowait(item)
+            except Full:
+                continue
+            return
+
+    def flush(self) -> None:
+        """Flush the wrapped handlers."""
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Close the handler, without closing the wrapped handlers that may still be writing."""
+        logging.Handler.close(self)
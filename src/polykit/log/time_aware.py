@@ -1,21 +1,49 @@
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
     from types import TracebackType
 
+    type ExcInfo = (
+        bool
+        | tuple[type[BaseException], BaseException, TracebackType | None]
+        | tuple[None, None, None]
+        | BaseException
+        | None
+    )
+
 
 @dataclass
 class TimeAwareLogger(logging.Logger):
-    """A logger class that formats datetime objects into human-readable strings."""
+    """A logger class that formats datetime objects into human-readable strings.
+
+    Datetime arguments are only formatted once the level check passes, so filtered-out calls cost
+    no more than they would on a regular logger. Use `for_logger()` to get the wrapper for a
+    logger, which is created once per logger name and reused after that.
+    """
 
     logger: logging.Logger
 
+    _instances: ClassVar[dict[str, TimeAwareLogger]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def for_logger(cls, logger: logging.Logger) -> TimeAwareLogger:
+        """Get the time-aware wrapper for a logger, creating it only the first time."""
+        wrapper = cls._instances.get(logger.name)
+        if wrapper is None or wrapper.logger is not logger:
+            with cls._instances_lock:
+                wrapper = cls._instances.get(logger.name)
+                if wrapper is None or wrapper.logger is not logger:
+                    wrapper = cls._instances[logger.name] = cls(logger)
+        return wrapper
+
     def __getattr__(self, item: Any) -> Any:
         """Delegate attribute access to the underlying logger object.
 
@@ -29,15 +57,35 @@ class TimeAwareLogger(logging.Logger):
 
         return [get_pretty_time(arg) if isinstance(arg, datetime) else arg for arg in args]
 
+    def _log_formatted(
+        self,
+        level: int,
+        msg: object,
+        args: tuple[object, ...],
+        exc_info: ExcInfo,
+        stack_info: bool,
+        stacklevel: int,
+        extra: Mapping[str, object] | None,
+    ) -> None:
+        """Format datetime arguments and log, if the level is enabled."""
+        if not self.logger.isEnabledFor(level):
+            return
+
+        self.logger.log(
+            level,
+            msg,
+            *self._format_args(*args),
+            exc_info=exc_info,
+            stack_info=stack_info,
+            stacklevel=stacklevel + 2,  # Skip this method and the level method that called it
+            extra=extra,
+        )
+
     def debug(
         self,
         msg: object,
         *args: object,
-        exc_info: bool
-        | tuple[type[BaseException], BaseException, TracebackType | None]
-        | tuple[None, None, None]
-        | BaseException
-        | None = None,
+        exc_info: ExcInfo = None,
         stack_info: bool = False,
         stacklevel: int = 1,
         extra: Mapping[str, object] | None = None,
@@ -48,25 +96,13 @@ class TimeAwareLogger(logging.Logger):
 
         logger.debug("Houston, we have a %s", "thorny problem", exc_info=True)
         """
-        formatted_args = self._format_args(*args)
-        self.logger.debug(
-            msg,
-            *formatted_args,
-            exc_info=exc_info,
-            stack_info=stack_info,
-            stacklevel=stacklevel + 1,
-            extra=extra,
-        )
+        self._log_formatted(logging.DEBUG, msg, args, exc_info, stack_info, stacklevel, extra)
 
     def info(
         self,
         msg: object,
         *args: object,
-        exc_info: bool
-        | tuple[type[BaseException], BaseException, TracebackType | None]
-        | tuple[None, None, None]
-        | BaseException
-        | None = None,
+        exc_info: ExcInfo = None,
         stack_info: bool = False,
         stacklevel: int = 1,
         extra: Mapping[str, object] | None = None,
@@ -77,25 +113,13 @@ class TimeAwareLogger(logging.Logger):
 
         logger.info("Houston, we have a %s", "notable problem", exc_info=True)
         """
-        formatted_args = self._format_args(*args)
-        self.logger.info(
-            msg,
-            *formatted_args,
-            exc_info=exc_info,
-            stack_info=stack_info,
-            stacklevel=stacklevel + 1,
-            extra=extra,
-        )
+        self._log_formatted(logging.INFO, msg, args, exc_info, stack_info, stacklevel, extra)
 
     def warning(
         self,
         msg: object,
         *args: object,
-        exc_info: bool
-        | tuple[type[BaseException], BaseException, TracebackType | None]
-        | tuple[None, None, None]
-        | BaseException
-        | None = None,
+        exc_info: ExcInfo = None,
         stack_info: bool = False,
         stacklevel: int = 1,
         extra: Mapping[str, object] | None = None,
@@ -106,25 +130,13 @@ class TimeAwareLogger(logging.Logger):
 
         logger.warning("Houston, we have a %s", "bit of a problem", exc_info=True)
         """
-        formatted_args = self._format_args(*args)
-        self.logger.warning(
-            msg,
-            *formatted_args,
-            exc_info=exc_info,
-            stack_info=stack_info,
-            stacklevel=stacklevel + 1,
-            extra=extra,
-        )
+        self._log_formatted(logging.WARNING, msg, args, exc_info, stack_info, stacklevel, extra)
 
     def error(
         self,
         msg: object,
         *args: object,
-        exc_info: bool
-        | tuple[type[BaseException], BaseException, TracebackType | None]
-        | tuple[None, None, None]
-        | BaseException
-        | None = None,
+        exc_info: ExcInfo = None,
         stack_info: bool = False,
         stacklevel: int = 1,
         extra: Mapping[str, object] | None = None,
@@ -135,12 +147,58 @@ class TimeAwareLogger(logging.Logger):
 
         logger.error("Houston, we have a %s", "major problem", exc_info=True)
         """
-        formatted_args = self._format_args(*args)
-        self.logger.error(
-            msg,
-            *formatted_args,
-            exc_info=exc_info,
-            stack_info=stack_info,
-            stacklevel=stacklevel + 1,
-            extra=extra,
-        )
+        self._log_formatted(logging.ERROR, msg, args, exc_info, stack_info, stacklevel, extra)
+
+    def exception(
+        self,
+        msg: object,
+        *args: object,
+        exc_info: ExcInfo = True,
+        stack_info: bool = False,
+        stacklevel: int = 1,
+        extra: Mapping[str, object] | None = None,
+    ) -> None:
+        """Log 'msg % args' with severity 'ERROR', along with the exception being handled.
+
+        Call this from an exception handler, e.g.
+
+        logger.exception("Houston, we had a problem at %s", datetime.now())
+        """
+        self._log_formatted(logging.ERROR, msg, args, exc_info, stack_info, stacklevel, extra)
+
+    def critical(
+        self,
+        msg: object,
+        *args: object,
+        exc_info: ExcInfo = None,
+        stack_info: bool = False,
+        stacklevel: int = 1,
+        extra: Mapping[str, object] | None = None,
+    ) -> None:
+        """Log 'msg % args' with severity 'CRITICAL'.
+
+        To pass exception information, use the keyword argument exc_info with a true value, e.g.
+
+        logger.critical("Houston, we have a %s", "serious problem", exc_info=True)
+        """
+        self._log_formatted(logging.CRITICAL, msg, args, exc_info, stack_info, stacklevel, extra)
+
+    fatal = critical
+
+    def log(
+        self,
+        level: int,
+        msg: object,
+        *args: object,
+        exc_info: ExcInfo = None,
+        stack_info: bool = False,
+        stacklevel: int = 1,
+        extra: Mapping[str, object] | None = None,
+    ) -> None:
+        """Log 'msg % args' with the integer severity 'level'.
+
+        To pass exception information, use the keyword argument exc_info with a true value, e.g.
+
+        logger.log(level, "Houston, we have a %s", "problem", exc_info=True)
+        """
+        self._log_formatted(level, msg, args, exc_info, stack_info, stacklevel, extra)
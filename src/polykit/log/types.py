@@ -31,6 +31,21 @@ class LogLevel(StrEnum):
             return LogColors.RESET.value
 
 
+class LogFormat(StrEnum):
+    """Output formats for log records."""
+
+    TEXT = "text"  # Human-readable lines, colored on the console
+    JSONL = "jsonl"  # One compact JSON object per line
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with a record when the logging queue is full."""
+
+    BLOCK = "block"  # Wait for room in the queue
+    DROP_OLDEST = "drop-oldest"  # Discard the oldest queued record to make room
+    DROP_DEBUG = "drop-debug"  # Discard DEBUG records, and wait for room for anything else
+
+
 LOG_LEVELS: dict[LogLevel, int] = {
     LogLevel.DEBUG: logging.DEBUG,
     LogLevel.INFO: logging.INFO,
@@ -1,4 +1,7 @@
 from __future__ import annotations
 
+from .cache import VersionCache
+from .index import DistributionIndex
 from .packages import VersionChecker
-from .types import PackageSource, VersionInfo
+from .types import PackageSource, PackageSpec, VersionInfo
+from .versions import VersionSet
@@ -0,0 +1,131 @@
+"""Time-limited on-disk cache for remote version lookups."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from polykit.core.json_store import JSONStore
+
+
+@dataclass
+class CachedVersion:
+    """A cached result of a remote version lookup.
+
+    Args:
+        value: The latest version found, or None if the lookup found nothing.
+        fetched: When the result was last confirmed, as a Unix timestamp.
+        etag: The ETag of the response the result came from, if the source sends one.
+    """
+
+    value: str | None
+    fetched: float
+    etag: str | None = None
+
+
+class VersionCache:
+    """Cache for PyPI and Git version lookups, in memory with optional on-disk persistence.
+
+    Results are fresh for `ttl` seconds, and lookups that found nothing are remembered for
+    `negative_ttl` seconds so a missing package doesn't cost a request on every run. Stale entries
+    are still kept: VersionChecker revalidates stale PyPI entries with If-None-Match, and falls back
+    to them when the network is unavailable. In offline mode, cached entries are always served
+    regardless of age and no lookups are made at all.
+
+    Args:
+        directory: An optional directory to persist entries in.
+        ttl: How long a found version stays fresh, in seconds.
+        negative_ttl: How long a lookup that found nothing stays fresh, in seconds.
+        offline: Whether to serve cached entries without ever going to the network.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        ttl: float = 3600,
+        negative_ttl: float = 300,
+        offline: bool = False,
+    ):
+        self.directory = Path(directory) if directory is not None else None
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.offline = offline
+
+        self._entries: dict[str, CachedVersion] = {}
+        self._lock = Lock()
+        self._store = JSONStore(self.directory) if self.directory is not None else None
+
+    @classmethod
+    def on_disk(cls, app_name: str = "polykit", **kwargs: Any) -> VersionCache:
+        """Create a cache persisted in the PolyPaths cache directory for the given app.
+
+        Args:
+            app_name: The application name used to locate the cache directory.
+            **kwargs: Additional arguments for the VersionCache constructor.
+        """
+        return cls(directory=JSONStore.app_cache_dir(app_name, "versions"), **kwargs)
+
+    def get(self, key: str) -> CachedVersion | None:
+        """Get the entry for a key, whether or not it's still fresh.
+
+        Args:
+            key: The lookup key, such as "pypi:requests".
+
+        Returns:
+            The cached entry, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and (entry := self._read_disk(key)) is not None:
+            with self._lock:
+                self._entries[key] = entry
+        return entry
+
+    def is_fresh(self, entry: CachedVersion) -> bool:
+        """Check whether an entry can be used without asking the source again."""
+        if self.offline:
+            return True
+        ttl = self.ttl if entry.value is not None else self.negative_ttl
+        return time.time() - entry.fetched < ttl
+
+    def put(self, key: str, value: str | None, etag: str | None = None) -> None:
+        """Store the result of a lookup.
+
+        Args:
+            key: The lookup key.
+            value: The version found, or None if the lookup found nothing.
+            etag: The ETag of the response, if any.
+        """
+        entry = CachedVersion(value, time.time(), etag)
+        with self._lock:
+            self._entries[key] = entry
+        self._write_disk(key, entry)
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as confirmed now, such as after a 304 Not Modified response."""
+        if (entry := self.get(key)) is not None:
+            self.put(key, entry.value, entry.etag)
+
+    def clear(self) -> None:
+        """Remove all entries, including those on disk."""
+        with self._lock:
+            self._entries.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def _read_disk(self, key: str) -> CachedVersion | None:
+        """Read an entry from disk, ignoring missing or unreadable files."""
+        if self._store is None or (data := self._store.read(key)) is None:
+            return None
+        try:
+            return CachedVersion(data["value"], float(data["fetched"]), data.get("etag"))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, key: str, entry: CachedVersion) -> None:
+        """Write an entry to disk, if the cache has a directory."""
+        if self._store is not None:
+            self._store.write(key, {"key": key, **asdict(entry)})
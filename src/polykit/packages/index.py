@@ -0,0 +1,163 @@
+"""Process-wide index of installed distributions, persisted between runs."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.metadata
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import ClassVar
+
+from packaging.utils import canonicalize_name
+
+from polykit.core.atomic import write_atomic
+
+# Bump when the stored layout changes so old files are ignored
+INDEX_FORMAT = 1
+
+SCRIPT_GROUPS = frozenset({"console_scripts", "gui_scripts"})
+
+
+@dataclass
+class DistributionIndex:
+    """Index of the installed distributions, their versions, locations and script entry points.
+
+    Scanning `importlib.metadata.distributions()` means reading the metadata of every installed
+    package, which gets slow in large environments. The index does that scan once, keeps the result
+    for the rest of the process, and stores it on disk for the next one. It is rebuilt whenever the
+    fingerprint of `sys.path` changes, which covers both a different path and packages being
+    installed or removed, since that changes the mtime of the directories they're installed in.
+
+    Distribution names are stored in canonical form (see `packaging.utils.canonicalize_name`), so
+    lookups are insensitive to case and to `-`, `_` and `.`. As with importlib.metadata, the first
+    distribution found on `sys.path` wins if the same one is installed more than once.
+
+    Args:
+        fingerprint: The fingerprint of `sys.path` the index was built for.
+        names: The display name of each distribution, by canonical name.
+        versions: The version of each distribution, by canonical name.
+        locations: The base location of each distribution (from `locate_file("")`), by canonical
+            name.
+        entry_points: The display name of the distribution providing each console or GUI script.
+    """
+
+    fingerprint: str
+    names: dict[str, str] = field(default_factory=dict)
+    versions: dict[str, str] = field(default_factory=dict)
+    locations: dict[str, str] = field(default_factory=dict)
+    entry_points: dict[str, str] = field(default_factory=dict)
+
+    _current: ClassVar[DistributionIndex | None] = None
+    _lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def current(cls, persist: bool = True) -> DistributionIndex:
+        """Get the index for the current environment, loading or building it only if needed.
+
+        Args:
+            persist: Whether to load the index from and save it to the PolyPaths cache directory.
+
+        Returns:
+            An index matching the current `sys.path`.
+        """
+        fingerprint = cls.fingerprint_path()
+        with cls._lock:
+            index = cls._current
+            if index is not None and index.fingerprint == fingerprint:
+                return index
+
+            cache_file = cls._cache_file() if persist else None
+            index = cls._load(cache_file, fingerprint) if cache_file else None
+            if index is None:
+                index = cls.build(fingerprint)
+                if cache_file is not None:
+                    with contextlib.suppress(OSError):
+                        data = {"format": INDEX_FORMAT, **asdict(index)}
+                        write_atomic(cache_file, json.dumps(data, separators=(",", ":")))
+
+            cls._current = index
+            return index
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the in-process index so the next lookup checks again."""
+        with cls._lock:
+            cls._current = None
+
+    @classmethod
+    def build(cls, fingerprint: str | None = None) -> DistributionIndex:
+        """Scan the installed distributions and build a new index.
+
+        Args:
+            fingerprint: The fingerprint to record, or None to compute it now.
+        """
+        index = cls(fingerprint or cls.fingerprint_path())
+        for dist in importlib.metadata.distributions():
+            try:
+                name = dist.metadata["Name"]
+                if not name:
+                    continue
+                key = canonicalize_name(name)
+                if key in index.names:
+                    continue
+
+                index.names[key] = name
+                index.versions[key] = dist.version
+                index.locations[key] = str(dist.locate_file(""))
+                for ep in dist.entry_points:
+                    if ep.group in SCRIPT_GROUPS:
+                        index.entry_points.setdefault(ep.name, name)
+            except Exception:  # Skip distributions with broken metadata
+                continue
+        return index
+
+    @staticmethod
+    def fingerprint_path() -> str:
+        """Fingerprint `sys.path` by its entries and their modification times."""
+        digest = hashlib.blake2b(sys.prefix.encode(), digest_size=16)
+        for entry in sys.path:
+            try:
+                mtime = Path(entry or ".").stat().st_mtime_ns
+            except OSError:
+                mtime = -1
+            digest.update(f"\0{entry}\0{mtime}".encode())
+        return digest.hexdigest()
+
+    def version(self, package: str) -> str | None:
+        """Get the installed version of a distribution, or None if it isn't installed."""
+        return self.versions.get(canonicalize_name(package))
+
+    def location(self, package: str) -> Path | None:
+        """Get the base location of a distribution, or None if it isn't installed."""
+        location = self.locations.get(canonicalize_name(package))
+        return Path(location) if location is not None else None
+
+    def package_for_script(self, script_name: str) -> str | None:
+        """Get the name of the distribution providing a console or GUI script."""
+        return self.entry_points.get(script_name)
+
+    @staticmethod
+    def _cache_file() -> Path | None:
+        """Get the file the index is stored in, with one file per environment."""
+        from polykit.paths import PolyPaths
+
+        environment = hashlib.blake2b(sys.prefix.encode(), digest_size=8).hexdigest()
+        try:
+            return PolyPaths("polykit").from_cache("distributions", f"{environment}.json")
+        except OSError:
+            return None
+
+    @classmethod
+    def _load(cls, path: Path, fingerprint: str) -> DistributionIndex | None:
+        """Load a stored index, or None if it's missing, unreadable or out of date."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.pop("format", None) != INDEX_FORMAT or data.get("fingerprint") != fingerprint:
+                return None
+            return cls(**data)
+        except (OSError, ValueError, TypeError):
+            return None
@@ -7,17 +7,121 @@ import importlib.metadata
 import inspect
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from threading import BoundedSemaphore, Lock
+from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import urlparse
 
 import requests
-from packaging import version
+from requests.adapters import HTTPAdapter
 
-from polykit.packages.types import PackageSource, VersionInfo
+from polykit.packages import simple
+from polykit.packages.index import DistributionIndex
+from polykit.packages.types import PackageSource, PackageSpec, VersionInfo
+from polykit.packages.versions import VersionSet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from polykit.packages.cache import CachedVersion, VersionCache
+
+PYPI_HOST = "pypi.org"
+
+
+@lru_cache(maxsize=1024)
+def _has_dev_files(directory: Path) -> bool:
+    """Check whether a directory contains a .git directory or a pyproject.toml file."""
+    return (directory / ".git").exists() or (directory / "pyproject.toml").exists()
+
+
+@lru_cache(maxsize=1024)
+def _resolve_path(path: str) -> Path:
+    """Resolve a path, caching the result since resolving makes a system call per component."""
+    return Path(path).resolve()
 
 
 class VersionChecker:
-    """Check for package versions from various sources."""
+    """Check for package versions from various sources.
+
+    All lookups made through one checker share a keep-alive HTTP session, and no more than
+    `per_host_limit` requests or `git ls-remote` calls run against the same host at once. That makes
+    a single checker safe to use from many threads, which is what check_packages() does.
+
+    If a VersionCache is given, PyPI and Git lookups are served from it while fresh, stale PyPI
+    entries are revalidated with a conditional request, and stale entries are used as a fallback
+    when the source can't be reached.
+
+    Args:
+        per_host_limit: The maximum number of concurrent lookups against a single host.
+        session: An optional requests session to use instead of creating one.
+        cache: An optional cache for remote version lookups.
+    """
+
+    _dev_verdicts: ClassVar[dict[tuple[str, str, str], bool]] = {}
+
+    def __init__(
+        self,
+        per_host_limit: int = 4,
+        session: requests.Session | None = None,
+        cache: VersionCache | None = None,
+    ):
+        self.per_host_limit = per_host_limit
+        self.cache = cache
+        self._session = session
+        self._host_slots: dict[str, BoundedSemaphore] = {}
+        self._lock = Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared HTTP session, created on first use with a pool sized to the host limit."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=self.per_host_limit)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    @contextmanager
+    def _host_slot(self, host: str) -> Iterator[None]:
+        """Hold one of the concurrent lookup slots for a host."""
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = BoundedSemaphore(self.per_host_limit)
+        with slot:
+            yield
+
+    def _cached_lookup(self, key: str) -> tuple[CachedVersion | None, bool]:
+        """Get the cached entry for a lookup and whether it can be used without going remote.
+
+        Returns:
+            The cached entry (or None), and True if the caller should return its value as-is,
+            either because it's fresh or because the cache is in offline mode.
+        """
+        if self.cache is None:
+            return None, False
+        entry = self.cache.get(key)
+        if self.cache.offline:
+            return entry, True
+        return entry, entry is not None and self.cache.is_fresh(entry)
+
+    def _remember(self, key: str, value: str | None, etag: str | None = None) -> str | None:
+        """Store a lookup result in the cache, if there is one, and return the value."""
+        if self.cache is not None:
+            self.cache.put(key, value, etag)
+        return value
+
+    @staticmethod
+    def _url_host(repo_url: str) -> str:
+        """Get the host from a Git URL, including SSH URLs like git@host:owner/repo.git."""
+        if "://" in repo_url:
+            return urlparse(repo_url).hostname or repo_url
+        return repo_url.split("@", 1)[-1].split(":", 1)[0]
 
     def get_installed_version(self, package: str) -> str | None:
         """Get the currently installed version of a package.
@@ -28,9 +132,9 @@ class VersionChecker:
         Returns:
             The version string, or None if not installed.
         """
-        try:
-            import importlib.metadata
-
+        if installed := DistributionIndex.current().version(package):
+            return installed
+        try:  # Fall back to a direct lookup for distributions found outside sys.path
             return importlib.metadata.version(package)
         except (importlib.metadata.PackageNotFoundError, ImportError):
             return None
@@ -44,13 +148,92 @@ class VersionChecker:
         Returns:
             The latest version string or None if not found.
         """
+        return self._fetch_version(
+            f"pypi:{package.lower()}",
+            f"https://{PYPI_HOST}/pypi/{package}/json",
+            lambda response: response.json()["info"]["version"],
+        )
+
+    def get_index_version(
+        self,
+        package: str,
+        index_url: str,
+        include_prereleases: bool = False,
+    ) -> str | None:
+        """Get the latest version of a package from a PEP 691 JSON simple index.
+
+        Only the project's file list is fetched, not the metadata of any release, and yanked files
+        are skipped. Indexes that only serve PEP 503 HTML are read too. A `file://` URL (or a plain
+        path) reads a local directory standing in for the index instead; see
+        `simple.versions_from_directory` for the layouts it understands.
+
+        Args:
+            package: The name of the package to check.
+            index_url: The base URL of the simple index, such as "https://pypi.org/simple".
+            include_prereleases: Whether prereleases count as the latest version even when there
+                are final releases.
+
+        Returns:
+            The latest version string or None if not found.
+        """
+        if simple.is_local_index(index_url):
+            try:
+                versions = simple.versions_from_directory(index_url, package)
+                return simple.latest_version(versions, include_prereleases)
+            except (OSError, ValueError):
+                return None
+
+        return self._fetch_version(
+            f"index:{index_url.rstrip('/')}#{package.lower()}#{include_prereleases}",
+            simple.project_url(index_url, package),
+            lambda response: simple.latest_version(
+                simple.versions_from_response(
+                    response.headers.get("Content-Type", ""), response.text, package
+                ),
+                include_prereleases,
+            ),
+            accept=simple.SIMPLE_JSON_ACCEPT,
+        )
+
+    def _fetch_version(
+        self,
+        key: str,
+        url: str,
+        parse: Callable[[requests.Response], str | None],
+        accept: str | None = None,
+    ) -> str | None:
+        """Fetch a version over HTTP through the cache, revalidating stale entries with their ETag.
+
+        Args:
+            key: The cache key for this lookup.
+            url: The URL to fetch.
+            parse: A function that gets the version from a successful response.
+            accept: An optional Accept header to send.
+
+        Returns:
+            The version found, a stale cached version if the source can't be reached, or None.
+        """
+        cached, use_cached = self._cached_lookup(key)
+        if use_cached:
+            return cached.value if cached else None
+
+        headers = {"Accept": accept} if accept else {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        stale = cached.value if cached else None
         try:
-            response = requests.get(f"https://pypi.org/pypi/{package}/json", timeout=5)
+            with self._host_slot(self._url_host(url)):
+                response = self.session.get(url, headers=headers, timeout=5)
+            if response.status_code == 304 and self.cache is not None:
+                self.cache.touch(key)
+                return stale
             if response.status_code == 200:
-                return response.json()["info"]["version"]
-            return None
+                return self._remember(key, parse(response), response.headers.get("ETag"))
+            if response.status_code == 404:
+                return self._remember(key, None)
+            return stale
         except Exception:
-            return None
+            return stale
 
     def get_git_version(self, repo_url: str, tag_prefix: str = "v") -> str | None:
         """Get the latest version from a Git repository's tags.
@@ -62,33 +245,34 @@ class VersionChecker:
         Returns:
             The latest version string or None if not found.
         """
-        try:
-            result = subprocess.run(
-                ["git", "ls-remote", "--tags", repo_url],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            # Get all version tags and clean them up
-            versions = []
-            for ref in result.stdout.splitlines():
-                tag = ref.split("/")[-1]
-                # Extract version part after the prefix
-                if tag.startswith(tag_prefix):
-                    # Clean up Git ref notation and parse version
-                    clean_tag = tag.split("^")[0].removeprefix(tag_prefix)
-                    try:
-                        versions.append(version.parse(clean_tag))
-                    except version.InvalidVersion:
-                        continue
-
-            # Sort with packaging.version comparison
-            if versions:
-                return str(max(versions))
-            return None
+        key = f"git:{repo_url}#{tag_prefix}"
+        cached, use_cached = self._cached_lookup(key)
+        if use_cached:
+            return cached.value if cached else None
 
+        try:
+            with self._host_slot(self._url_host(repo_url)):
+                result = subprocess.run(
+                    ["git", "ls-remote", "--tags", repo_url],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
         except subprocess.CalledProcessError:
-            return None
+            # An unreachable remote looks the same as a missing one, so prefer a stale result
+            if cached is not None and cached.value is not None:
+                return cached.value
+            return self._remember(key, None)
+
+        return self._remember(key, self._latest_tag(result.stdout, tag_prefix))
+
+    @staticmethod
+    def _latest_tag(ls_remote_output: str, tag_prefix: str) -> str | None:
+        """Find the highest version among the tags listed by `git ls-remote --tags`."""
+        # Clean up Git ref notation, like refs/tags/v1.0^{}, to get the tag names
+        tags = (ref.split("/")[-1].split("^")[0] for ref in ls_remote_output.splitlines())
+        latest = VersionSet.from_tags(tags, tag_prefix).latest(include_prereleases=True)
+        return str(latest) if latest else None
 
     def get_github_version(
         self,
@@ -154,6 +338,7 @@ class VersionChecker:
                 For GitHub: owner, repo, use_ssh, tag_prefix
                 For GitLab: host, owner, repo, use_ssh, tag_prefix
                 For Git: repo_url, tag_prefix
+                For Index: index_url, include_prereleases
 
         Returns:
             VersionInfo containing current and latest versions.
@@ -173,7 +358,28 @@ class VersionChecker:
         elif source == PackageSource.PYPI:
             latest = self.get_pypi_version(package)
 
-        elif source == PackageSource.GITHUB:
+        elif source == PackageSource.INDEX:
+            index_url = kwargs.get("index_url")
+            include_prereleases = kwargs.get("include_prereleases", False)
+
+            if not index_url:
+                msg = "Index URL is required"
+                raise ValueError(msg)
+
+            latest = self.get_index_version(package, index_url, include_prereleases)
+
+        elif source in {PackageSource.GITHUB, PackageSource.GITLAB, PackageSource.GIT}:
+            latest = self._get_repo_version(package, source, **kwargs)
+
+        return VersionInfo(package, current, latest, source, is_development)
+
+    def _get_repo_version(self, package: str, source: PackageSource, **kwargs: Any) -> str | None:
+        """Get the latest version from a GitHub, GitLab or plain Git repository's tags.
+
+        Raises:
+            ValueError: If required arguments are missing for the source.
+        """
+        if source == PackageSource.GITHUB:
             owner = kwargs.get("owner")
             repo = kwargs.get("repo", package)
             use_ssh = kwargs.get("use_ssh", False)
@@ -183,9 +389,9 @@ class VersionChecker:
                 msg = "GitHub owner is required"
                 raise ValueError(msg)
 
-            latest = self.get_github_version(owner, repo, use_ssh, tag_prefix)
+            return self.get_github_version(owner, repo, use_ssh, tag_prefix)
 
-        elif source == PackageSource.GITLAB:
+        if source == PackageSource.GITLAB:
             host = kwargs.get("host", "gitlab.com")
             owner = kwargs.get("owner")
             repo = kwargs.get("repo", package)
@@ -196,9 +402,9 @@ class VersionChecker:
                 msg = "GitLab owner is required"
                 raise ValueError(msg)
 
-            latest = self.get_gitlab_version(host, owner, repo, use_ssh, tag_prefix)
+            return self.get_gitlab_version(host, owner, repo, use_ssh, tag_prefix)
 
-        elif source == PackageSource.GIT:
+        if source == PackageSource.GIT:
             repo_url = kwargs.get("repo_url")
             tag_prefix = kwargs.get("tag_prefix", "v")
 
@@ -206,69 +412,122 @@ class VersionChecker:
                 msg = "Git repository URL is required"
                 raise ValueError(msg)
 
-            latest = self.get_git_version(repo_url, tag_prefix)
+            return self.get_git_version(repo_url, tag_prefix)
 
-        return VersionInfo(package, current, latest, source, is_development)
+        return None
 
-    def is_development_version(self, package: str) -> bool:
-        """Determine if the installed package is a development version.
+    def check_packages(
+        self,
+        specs: Iterable[str | PackageSpec],
+        max_workers: int = 8,
+    ) -> Iterator[VersionInfo]:
+        """Check many packages concurrently, yielding results as they complete.
+
+        PyPI and Git lookups run in a thread pool and share this checker's HTTP session and per-host
+        limits, so a large batch doesn't open a new connection per package or flood a single host.
+        Results are yielded in completion order, not the order of `specs`.
 
         Args:
-            package: The name of the package to check.
+            specs: The packages to check, either as names (checked with PackageSource.AUTO) or as
+                PackageSpec objects with a source and its arguments.
+            max_workers: The maximum number of packages to check at once.
 
-        Returns:
-            True if it's a development version, False if it's from PyPI or not installed.
+        Yields:
+            VersionInfo for each package as soon as its lookup finishes.
+
+        Raises:
+            ValueError: If required arguments are missing for a package's source.
         """
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="version-check")
         try:
-            import importlib.metadata
-            import sys
-            from pathlib import Path
+            futures = [
+                executor.submit(self.check_package, spec.package, spec.source, **spec.options)
+                for spec in (PackageSpec(s) if isinstance(s, str) else s for s in specs)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            # Get the package location
-            dist = importlib.metadata.distribution(package)
-            package_location = Path(str(dist.locate_file("")))
+    def check_installed(
+        self,
+        source: PackageSource = PackageSource.PYPI,
+        max_workers: int = 8,
+    ) -> Iterator[VersionInfo]:
+        """Check every installed distribution, yielding results as they complete.
 
-            # Check for editable install
-            if package_location.name.endswith(".egg-link"):
-                return True
+        Args:
+            source: Where to check for the latest versions. Only sources that can be found from the
+                package name alone (PyPI or AUTO) make sense here.
+            max_workers: The maximum number of packages to check at once.
 
-            # Check for development markers in path
-            dev_markers = ["dev", "develop", "source", "src", "projects", "workspace", "monorepo"]
-            if any(marker in str(package_location).lower() for marker in dev_markers):
-                return True
+        Yields:
+            VersionInfo for each installed distribution as soon as its lookup finishes.
+        """
+        return self.check_packages(
+            (PackageSpec(name, source) for name in self.installed_packages()), max_workers
+        )
 
-            # Check for development files in ancestry
-            parent_dir = package_location
-            for _ in range(8):  # Check up to 8 levels up
-                if (parent_dir / ".git").exists() or (parent_dir / "pyproject.toml").exists():
-                    return True
-                parent_dir = parent_dir.parent
+    @staticmethod
+    def installed_packages() -> list[str]:
+        """Get the names of all installed distributions, without duplicates.
 
-            # Check for development version indicators in the version string
-            version_str = dist.version
-            if any(marker in version_str for marker in ["dev", "a", "b", "rc"]):
-                return True
+        Returns:
+            A sorted list of distribution names.
+        """
+        return sorted(DistributionIndex.current().names.values(), key=str.lower)
 
-            # Check if in same directory tree as current script
-            script_path = Path(sys.argv[0]).resolve()
-            package_path = package_location.resolve()
-            try:
-                script_path.relative_to(package_path.parent.parent)
-                return True
-            except ValueError:
-                try:
-                    package_path.relative_to(script_path.parent.parent)
-                    return True
-                except ValueError:
-                    pass
+    def is_development_version(self, package: str) -> bool:
+        """Determine if the installed package is a development version.
 
-            # If we've passed all checks, it's likely a PyPI version
-            return False
+        Args:
+            package: The name of the package to check.
 
-        except (importlib.metadata.PackageNotFoundError, Exception):
+        Returns:
+            True if it's a development version, False if it's from PyPI or not installed.
+        """
+        try:
+            index = DistributionIndex.current()
+            package_location = index.location(package)
+            version_str = index.version(package)
+            if package_location is None or version_str is None:
+                return False
+            return self.is_development_install(package_location, version_str)
+
+        except Exception:
             # If any error occurs, assume it's not a development version
             return False
 
+    @classmethod
+    def is_development_install(cls, package_location: Path, version: str) -> bool:
+        """Decide whether a distribution at a location is a development install.
+
+        The cheap checks on the path and version string run first, and the ancestry walk runs last,
+        with each directory's probe for development files cached so distributions that share
+        parents (like everything in site-packages) don't repeat them. The verdict is memoized per
+        location, version and running script, so repeated calls during setup are free.
+
+        Args:
+            package_location: The base location of the distribution.
+            version: The installed version string.
+
+        Returns:
+            True if it's a development install, False otherwise.
+        """
+        script = sys.argv[0]
+        key = (str(package_location), version, script)
+        if (verdict := cls._dev_verdicts.get(key)) is None:
+            verdict = cls._dev_verdicts[key] = (
+                cls.is_editable_install(package_location)
+                or cls.has_dev_version_markers(version)
+                or cls.has_dev_markers_in_path(package_location)
+                or cls.is_in_same_directory_tree(
+                    _resolve_path(script), _resolve_path(str(package_location))
+                )
+                or cls.has_dev_files_in_ancestry(package_location)
+            )
+        return verdict
+
     @staticmethod
     def get_caller_package_name() -> str:
         """Determine the package name from the running script.
@@ -303,20 +562,9 @@ class VersionChecker:
             The package name if found, or None if not.
         """
         try:
-            for dist in importlib.metadata.distributions():
-                try:
-                    entry_points = dist.entry_points
-                    for ep in entry_points:
-                        if ep.name == script_name and ep.group in {
-                            "console_scripts",
-                            "gui_scripts",
-                        }:
-                            return dist.metadata["Name"]
-                except Exception:
-                    continue
+            return DistributionIndex.current().package_for_script(script_name)
         except Exception:
-            pass
-        return None
+            return None
 
     @staticmethod
     def find_package_by_config_files(module_path: Path) -> str | None:
@@ -395,7 +643,7 @@ class VersionChecker:
         """
         parent_dir = package_location
         for _ in range(max_levels):
-            if (parent_dir / ".git").exists() or (parent_dir / "pyproject.toml").exists():
+            if _has_dev_files(parent_dir):
                 return True
             parent_dir = parent_dir.parent
         return False
@@ -436,23 +684,18 @@ class VersionChecker:
         Returns:
             VersionInfo object with version details.
         """
+        index = DistributionIndex.current()
         try:
-            version = importlib.metadata.version(package_name)
+            version = index.version(package_name) or importlib.metadata.version(package_name)
             is_pypi = True
 
             try:  # Get the package location
-                dist = importlib.metadata.distribution(package_name)
-                package_location = Path(str(dist.locate_file("")))
-
-                if (  # Run through checks to determine if this is a development version
-                    VersionChecker.is_editable_install(package_location)
-                    or VersionChecker.has_dev_markers_in_path(package_location)
-                    or VersionChecker.has_dev_files_in_ancestry(package_location)
-                    or VersionChecker.has_dev_version_markers(version)
-                    or VersionChecker.is_in_same_directory_tree(
-                        Path(sys.argv[0]).resolve(), package_location.resolve()
-                    )
-                ):
+                package_location = index.location(package_name)
+                if package_location is None:
+                    dist = importlib.metadata.distribution(package_name)
+                    package_location = Path(str(dist.locate_file("")))
+
+                if VersionChecker.is_development_install(package_location, version):
                     is_pypi = False
 
             except Exception:  # If an error occurs during detection, assume it's a dev version
@@ -0,0 +1,135 @@
+"""Read project versions from a PEP 691 JSON simple index or a local stand-in directory."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from packaging import version
+from packaging.utils import (
+    InvalidSdistFilename,
+    InvalidWheelFilename,
+    canonicalize_name,
+    parse_sdist_filename,
+    parse_wheel_filename,
+)
+
+from polykit.packages.versions import VersionSet
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Prefer PEP 691 JSON, but accept the PEP 503 HTML that older mirrors still serve
+SIMPLE_JSON_ACCEPT = (
+    "application/vnd.pypi.simple.v1+json, application/vnd.pypi.simple.v1+html;q=0.2, "
+    "text/html;q=0.01"
+)
+
+ANCHOR_PATTERN = re.compile(r"<a\b([^>]*)>([^<]*)</a>", re.IGNORECASE)
+
+
+def project_url(index_url: str, project: str) -> str:
+    """Get the URL of a project's page on a simple index."""
+    return f"{index_url.rstrip('/')}/{canonicalize_name(project)}/"
+
+
+def is_local_index(index_url: str) -> bool:
+    """Check whether an index URL points to a local directory."""
+    return urlparse(index_url).scheme in {"file", ""}
+
+
+def version_from_filename(filename: str, project: str) -> str | None:
+    """Get the version from a wheel or sdist filename, if it belongs to the project.
+
+    Returns:
+        The version string, or None if the file isn't a distribution of this project.
+    """
+    try:
+        if filename.endswith(".whl"):
+            name, parsed, _, _ = parse_wheel_filename(filename)
+        else:
+            name, parsed = parse_sdist_filename(filename)
+    except (InvalidWheelFilename, InvalidSdistFilename, version.InvalidVersion):
+        return None
+    return str(parsed) if name == canonicalize_name(project) else None
+
+
+def versions_from_json(data: dict[str, Any], project: str) -> Iterator[str]:
+    """Yield the distinct, non-yanked versions listed in a PEP 691 project response.
+
+    Versions are read from the file list one entry at a time and each distinct version is yielded
+    once, so a project with many wheels per release doesn't parse the same version repeatedly. The
+    PEP 700 `versions` key is only used when there are no files to read, since it doesn't say which
+    releases are yanked.
+    """
+    seen: set[str] = set()
+    files = data.get("files") or []
+    for entry in files:
+        if entry.get("yanked"):
+            continue
+        found = version_from_filename(entry.get("filename", ""), project)
+        if found is not None and found not in seen:
+            seen.add(found)
+            yield found
+
+    if not files:
+        yield from (str(value) for value in data.get("versions", []))
+
+
+def versions_from_html(text: str, project: str) -> Iterator[str]:
+    """Yield the distinct, non-yanked versions linked from a PEP 503 HTML project page."""
+    seen: set[str] = set()
+    for match in ANCHOR_PATTERN.finditer(text):
+        if "data-yanked" in match.group(1):
+            continue
+        found = version_from_filename(match.group(2).strip(), project)
+        if found is not None and found not in seen:
+            seen.add(found)
+            yield found
+
+
+def versions_from_response(content_type: str, text: str, project: str) -> Iterator[str]:
+    """Yield the versions from a simple index response, in whichever format it was served."""
+    if "json" in content_type:
+        return versions_from_json(json.loads(text), project)
+    return versions_from_html(text, project)
+
+
+def versions_from_directory(index_url: str, project: str) -> Iterator[str]:
+    """Yield the versions available in a local directory standing in for an index.
+
+    The project's directory may contain a PEP 691 `index.json`, or just the distribution files
+    themselves. If there's no project directory, distribution files directly in the index directory
+    are used instead, like pip's `--find-links`.
+    """
+    root = Path(url2pathname(urlparse(index_url).path))
+    project_dir = root / canonicalize_name(project)
+
+    index_file = project_dir / "index.json"
+    if index_file.is_file():
+        yield from versions_from_json(json.loads(index_file.read_text(encoding="utf-8")), project)
+        return
+
+    directory = project_dir if project_dir.is_dir() else root
+    seen: set[str] = set()
+    for path in directory.iterdir():
+        found = version_from_filename(path.name, project)
+        if found is not None and found not in seen:
+            seen.add(found)
+            yield found
+
+
+def latest_version(versions: Iterable[str], include_prereleases: bool = False) -> str | None:
+    """Get the highest version, preferring final releases unless prereleases are included.
+
+    Returns:
+        The highest version, a prerelease only if there are no final releases (or if they're
+        included), or None if there are no valid versions at all.
+    """
+    available = VersionSet(versions)
+    latest = available.latest(include_prereleases) or available.latest(include_prereleases=True)
+    return str(latest) if latest else None
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
+from typing import TYPE_CHECKING, Any
 
-from packaging import version
+from polykit.packages.versions import parse_version
+
+if TYPE_CHECKING:
+    from packaging.version import Version
 
 
 @dataclass
@@ -16,19 +20,31 @@ class VersionInfo:
     source: str | None = None
     is_development: bool = False
 
+    @property
+    def current_version(self) -> Version | None:
+        """The parsed current version, or None if it's missing or invalid."""
+        return parse_version(self.current) if self.current else None
+
+    @property
+    def latest_version(self) -> Version | None:
+        """The parsed latest version, or None if it's missing or invalid."""
+        return parse_version(self.latest) if self.latest else None
+
     @property
     def is_latest(self) -> bool:
         """Check if current version is the latest."""
-        if not self.current or not self.latest:
+        current, latest = self.current_version, self.latest_version
+        if current is None or latest is None:
             return False
-        return version.parse(self.current) >= version.parse(self.latest)
+        return current >= latest
 
     @property
     def update_available(self) -> bool:
         """Check if an update is available."""
-        if not self.current or not self.latest:
+        current, latest = self.current_version, self.latest_version
+        if current is None or latest is None:
             return False
-        return version.parse(self.latest) > version.parse(self.current)
+        return latest > current
 
     def __str__(self) -> str:
         """String representation of version info."""
@@ -51,4 +67,20 @@ class PackageSource(StrEnum):
     GITHUB = "github"
     GITLAB = "gitlab"
     GIT = "git"
+    INDEX = "index"
     AUTO = "auto"
+
+
+@dataclass
+class PackageSpec:
+    """A package to check and where to look for its latest version.
+
+    Args:
+        package: The name of the package to check.
+        source: Where to check for the latest version.
+        options: Additional arguments for the source checker, as accepted by check_package().
+    """
+
+    package: str
+    source: PackageSource = PackageSource.AUTO
+    options: dict[str, Any] = field(default_factory=dict)
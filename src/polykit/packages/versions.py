@@ -0,0 +1,170 @@
+"""Sorted sets of parsed versions with fast specifier queries."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from packaging.specifiers import SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+@lru_cache(maxsize=4096)
+def parse_version(value: str) -> Version | None:
+    """Parse a version string, caching the result.
+
+    Returns:
+        The parsed version, or None if the string isn't a valid version.
+    """
+    try:
+        return Version(value)
+    except InvalidVersion:
+        return None
+
+
+class VersionSet:
+    """A set of versions, parsed once and kept sorted for queries by bisection.
+
+    Invalid versions are skipped. Queries that take a specifier narrow the range with bisection on
+    the specifier's bounds first, so only the versions near the top of that range are checked
+    against the full specifier.
+
+    Args:
+        versions: The versions to include, as strings or parsed versions.
+    """
+
+    def __init__(self, versions: Iterable[str | Version] = ()):
+        parsed = {
+            value if isinstance(value, Version) else parse_version(value) for value in versions
+        }
+        parsed.discard(None)
+        self._versions: list[Version] = sorted(parsed)  # type: ignore[arg-type]
+
+    @classmethod
+    def from_tags(cls, tags: Iterable[str], prefix: str = "v") -> VersionSet:
+        """Build a set from tag names, keeping only those with the given prefix.
+
+        Args:
+            tags: The tag names, such as "v1.2.0".
+            prefix: The prefix version tags start with.
+        """
+        return cls(tag.removeprefix(prefix) for tag in tags if tag.startswith(prefix))
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __iter__(self) -> Iterator[Version]:
+        return iter(self._versions)
+
+    def __contains__(self, value: object) -> bool:
+        parsed = parse_version(value) if isinstance(value, str) else value
+        if not isinstance(parsed, Version):
+            return False
+        index = bisect_left(self._versions, parsed)
+        return index < len(self._versions) and self._versions[index] == parsed
+
+    def __repr__(self) -> str:
+        return f"VersionSet({[str(value) for value in self._versions]!r})"
+
+    def latest(self, include_prereleases: bool = False) -> Version | None:
+        """Get the highest version.
+
+        Args:
+            include_prereleases: Whether prereleases and dev releases can be returned.
+
+        Returns:
+            The highest version, or None if there are none (or only prereleases, if excluded).
+        """
+        for value in reversed(self._versions):
+            if include_prereleases or not value.is_prerelease:
+                return value
+        return None
+
+    def latest_matching(
+        self, specifier: str | SpecifierSet, include_prereleases: bool | None = None
+    ) -> Version | None:
+        """Get the highest version that satisfies a specifier, such as ">=2,<3".
+
+        Args:
+            specifier: The version specifier to satisfy.
+            include_prereleases: Whether prereleases can match. The default follows PEP 440, which
+                only allows them if the specifier itself mentions one.
+
+        Returns:
+            The highest matching version, or None if no version matches.
+        """
+        specifiers = SpecifierSet(specifier) if isinstance(specifier, str) else specifier
+        if include_prereleases is None:
+            include_prereleases = bool(specifiers.prereleases)
+
+        low, high = self._bounds(specifiers)
+        for index in range(high - 1, low - 1, -1):
+            if specifiers.contains(self._versions[index], prereleases=include_prereleases):
+                return self._versions[index]
+        return None
+
+    def next_minor(self, current: str | Version) -> Version | None:
+        """Get the first final release of a later minor version than `current`.
+
+        For example, with 1.4.2 as the current version, this finds the lowest 1.5.x or later.
+        """
+        parsed = parse_version(current) if isinstance(current, str) else current
+        if parsed is None:
+            return None
+        return self._first_final_from(Version(f"{parsed.major}.{parsed.minor + 1}.dev0"))
+
+    def next_major(self, current: str | Version) -> Version | None:
+        """Get the first final release of a later major version than `current`."""
+        parsed = parse_version(current) if isinstance(current, str) else current
+        if parsed is None:
+            return None
+        return self._first_final_from(Version(f"{parsed.major + 1}.dev0"))
+
+    def newer_than(self, current: str | Version) -> list[Version]:
+        """Get all versions higher than `current`, in ascending order."""
+        parsed = parse_version(current) if isinstance(current, str) else current
+        if parsed is None:
+            return []
+        return self._versions[bisect_right(self._versions, parsed) :]
+
+    def _first_final_from(self, floor: Version) -> Version | None:
+        """Get the lowest final release at or above `floor`."""
+        for value in self._versions[bisect_left(self._versions, floor) :]:
+            if not value.is_prerelease:
+                return value
+        return None
+
+    def _bounds(self, specifiers: SpecifierSet) -> tuple[int, int]:
+        """Narrow the index range that can satisfy a specifier set, using its simple bounds."""
+        low, high = 0, len(self._versions)
+        for spec in specifiers:
+            if spec.version.endswith(".*") or spec.operator == "===":
+                continue  # Wildcards and arbitrary equality are left to the full check
+            bound = parse_version(spec.version)
+            if bound is None:
+                continue
+
+            if spec.operator in {">=", "~="}:
+                low = max(low, bisect_left(self._versions, bound))
+            elif spec.operator == ">":
+                low = max(low, bisect_right(self._versions, bound))
+            elif spec.operator == "<":
+                high = min(high, bisect_left(self._versions, bound))
+            elif spec.operator == "<=":
+                high = min(high, self._upper_index(bound))
+            elif spec.operator == "==":
+                low = max(low, bisect_left(self._versions, bound))
+                high = min(high, self._upper_index(bound))
+        return low, max(low, high)
+
+    def _upper_index(self, bound: Version) -> int:
+        """Get the index just past `bound`, including local versions of it like 1.0+local."""
+        index = bisect_right(self._versions, bound)
+        if bound.local is None:  # Local labels are ignored when matching a public version
+            while index < len(self._versions) and self._versions[index].public == bound.public:
+                index += 1
+        return index
@@ -1,4 +1,4 @@
 from __future__ import annotations
 
 from .detect import platform_check
-from .setup import polykit_setup
+from .setup import check_for_updates, polykit_setup
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
 
-from polykit.packages import VersionChecker, VersionInfo
+from polykit.packages import VersionCache, VersionChecker, VersionInfo
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from logging import Logger
 
-def polykit_setup() -> VersionInfo:
+# How often to check for updates by default, in seconds
+DEFAULT_UPDATE_INTERVAL = 24 * 60 * 60
+
+
+def polykit_setup(
+    check_updates: bool = False,
+    update_interval: float = DEFAULT_UPDATE_INTERVAL,
+    update_deadline: float = 5.0,
+    on_update: Callable[[VersionInfo], None] | None = None,
+) -> VersionInfo:
     """Configure the system with standard setup options.
 
     Sets up exception handling and automatically records version information.
 
+    Args:
+        check_updates: Whether to check for a newer release in the background. The check never
+            delays startup, and runs at most once per `update_interval`.
+        update_interval: The minimum number of seconds between update checks.
+        update_deadline: The maximum number of seconds the update check may take.
+        on_update: A function to call with the VersionInfo if an update is available. If not given,
+            the update is logged instead. It's called from the background thread that ran the
+            check, so it must be safe to call from any thread.
+
     Returns:
         VersionInfo object with version details. The return isn't needed if you aren't going to use
         it for anything, but it's available in case you need version information for something.
@@ -34,4 +59,96 @@ def polykit_setup() -> VersionInfo:
     logger = PolyLog.get_logger(level=level, simple=True)
     logger.debug("Starting %s", version_info)
 
+    if check_updates and not version_info.is_development:
+
+        def notify(future: Future[VersionInfo | None]) -> None:
+            info = future.result()
+            if info is None or not info.update_available:
+                return
+            if on_update is not None:
+                on_update(info)
+            else:
+                logger.info("Update available for %s: v%s", info.package, info.latest)
+
+        future = check_for_updates(package_name, update_interval, update_deadline, logger)
+        future.add_done_callback(notify)
+
     return version_info
+
+
+def check_for_updates(
+    package_name: str,
+    interval: float = DEFAULT_UPDATE_INTERVAL,
+    deadline: float = 5.0,
+    logger: Logger | None = None,
+) -> Future[VersionInfo | None]:
+    """Check for a newer release of a package on a background daemon thread.
+
+    The check is skipped if one was already started within the last `interval` seconds, according
+    to a stamp file in the PolyPaths state directory. The returned future always resolves within
+    `deadline` seconds: to None if the check was skipped, failed or ran out of time, or to the
+    VersionInfo otherwise. Nothing here blocks the caller, and the thread never keeps the process
+    alive at exit. Callbacks added to the future run on that background thread.
+
+    The check is best-effort: if the cache directory can't be used, results are only cached in
+    memory, and any other error is logged at debug level rather than shown to the user.
+
+    Args:
+        package_name: The name of the package to check.
+        interval: The minimum number of seconds between checks.
+        deadline: The maximum number of seconds to wait for the check.
+        logger: An optional logger for reporting a failed check.
+
+    Returns:
+        A future that resolves to the VersionInfo, or None if no result is available.
+    """
+    future: Future[VersionInfo | None] = Future()
+    future.set_running_or_notify_cancel()
+
+    def supervise() -> None:
+        if not _claim_update_check(package_name, interval):
+            future.set_result(None)
+            return
+
+        results: list[VersionInfo] = []
+
+        def check() -> None:
+            try:
+                try:
+                    cache = VersionCache.on_disk()
+                except OSError:  # The cache directory can't be created, so only cache in memory
+                    cache = VersionCache()
+                results.append(VersionChecker(cache=cache).check_package(package_name))
+            except Exception as e:  # Never let a background check print a traceback
+                if logger:
+                    logger.debug("Update check for %s failed: %s", package_name, e)
+
+        worker = threading.Thread(
+            target=check,
+            name=f"update-check-{package_name}",
+            daemon=True,
+        )
+        worker.start()
+        worker.join(deadline)
+        future.set_result(results[0] if results else None)
+
+    threading.Thread(target=supervise, name="update-check", daemon=True).start()
+    return future
+
+
+def _claim_update_check(package_name: str, interval: float) -> bool:
+    """Check the stamp file and, if a check is due, update it so no other process repeats it.
+
+    Returns:
+        True if a check is due, False if one was already done within the interval.
+    """
+    from polykit.paths import PolyPaths
+
+    try:
+        stamp = PolyPaths("polykit").from_state("update-checks", f"{package_name}.stamp")
+        if stamp.exists() and time.time() - stamp.stat().st_mtime < interval:
+            return False
+        stamp.touch()
+    except OSError:
+        return False
+    return True